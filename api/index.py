@@ -1,18 +1,54 @@
+import gzip
 from datetime import datetime
 from io import BytesIO
 
-from flask import Flask, render_template_string, request, send_file
+from flask import Flask, Response, request, send_file
 from openpyxl import Workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.chart import PieChart, Reference
 from openpyxl.chart.series import DataPoint
 from openpyxl.chart.label import DataLabelList
 
-from auto_table_core import TEMPLATE, get_table_data
+from auto_table_core import (
+    ASSET_HEADERS,
+    CHARTS_SCRIPT,
+    CHARTS_SCRIPT_URL,
+    REPORT_STYLESHEET,
+    REPORT_STYLESHEET_URL,
+    STYLESHEET,
+    STYLESHEET_URL,
+    accepts_gzip,
+    cache_html,
+    get_cached_html,
+    get_table_data,
+    html_headers,
+    iter_rows,
+    render_card,
+    rows_ndjson,
+    sheet_version,
+    stream_dashboard,
+    version_token,
+)
 
 app = Flask(__name__)
 
 
+@app.route(STYLESHEET_URL)
+def stylesheet():
+    # The URL carries a hash of the CSS, so it can be cached indefinitely
+    return Response(STYLESHEET, mimetype="text/css", headers=ASSET_HEADERS)
+
+
+@app.route(REPORT_STYLESHEET_URL)
+def report_stylesheet():
+    return Response(REPORT_STYLESHEET, mimetype="text/css", headers=ASSET_HEADERS)
+
+
+@app.route(CHARTS_SCRIPT_URL)
+def charts_script():
+    return Response(CHARTS_SCRIPT, mimetype="text/javascript", headers=ASSET_HEADERS)
+
+
 def _build_workbook(rows, stats, selected_columns, include_stats, filters):
     """Build an XLSX workbook matching current table + optional stats/charts."""
     wb = Workbook()
@@ -67,7 +103,7 @@ def _build_workbook(rows, stats, selected_columns, include_stats, filters):
     band_even_fill = PatternFill("solid", fgColor="F9FAFB")  # banding for even rows
     today = datetime.now().date()
 
-    for row_idx, row in enumerate(rows, start=3):
+    for row_idx, row in enumerate(iter_rows(rows), start=3):
         star = (row.get("Starlink Status") or "").lower()
         appr = (row.get("Approval") or "").lower()
         row_fill = None
@@ -277,6 +313,14 @@ def _build_workbook(rows, stats, selected_columns, include_stats, filters):
 @app.route("/<path:path>", methods=["GET"])
 def index(path: str):
     # Main dashboard handler (also handles report download when ?download=xlsx)
+    # Repeat views of the same filters are served from the rendered-page cache
+    cache_key = tuple(sorted(request.args.items(multi=True)))
+    gzip_ok = accepts_gzip(request.headers.get("Accept-Encoding"))
+    if request.args.get("download") != "xlsx":
+        body = get_cached_html(cache_key, sheet_version(), gzip_ok)
+        if body is not None:
+            return Response(body, mimetype="text/html", headers=html_headers(gzip_ok))
+
     selected_region = request.args.get("region", "").strip() or None
     raw_schedules = [s.strip() for s in request.args.getlist("schedule") if s.strip()]
     if not raw_schedules:
@@ -295,13 +339,17 @@ def index(path: str):
     selected_lot = request.args.get("lot", "").strip() or None
     selected_search = request.args.get("search", "").strip() or None
     include_unscheduled = request.args.get("full", "") == "1"
+    offset = request.args.get("offset", 0, type=int)
 
     (
         rows,
         region_options,
         schedule_options,
         installation_options,
+        _final_status_options,
+        _validated_options,
         stats,
+        version,
       ) = get_table_data(
           selected_region,
           selected_schedule,
@@ -312,6 +360,19 @@ def index(path: str):
           selected_search=selected_search,
     )
 
+    # Further table rows requested by the scroll handler, as one JSON array per line
+    if request.args.get("partial") == "ndjson":
+        # Rows from other sheet data than the card was rendered from would
+        # not line up with it; the client reloads the card on 409
+        if request.args.get("v") != version_token(version):
+            return Response(status=409, headers=html_headers(False))
+        body = rows_ndjson(rows, offset)
+        return Response(
+            gzip.compress(body, compresslevel=6) if gzip_ok else body,
+            mimetype="application/x-ndjson",
+            headers=html_headers(gzip_ok),
+        )
+
     # If download flag is present, stream XLSX instead of HTML
     if request.args.get("download") == "xlsx":
         selected_columns = request.args.getlist("col")
@@ -346,8 +407,7 @@ def index(path: str):
     else:
         selected_schedule_label = ", ".join(selected_schedule_list)
 
-    return render_template_string(
-        TEMPLATE,
+    context = dict(
         rows=rows,
         region_options=region_options,
         schedule_options=schedule_options,
@@ -364,7 +424,19 @@ def index(path: str):
         show_report=show_report,
         include_unscheduled=include_unscheduled,
         last_updated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        offset=offset,
     )
+    # Table and stats card alone, swapped in by the stats tiles
+    if request.args.get("partial") == "card":
+        html = render_card(version, **context)
+        compressed = cache_html(cache_key, version, html)
+        return Response(
+            compressed if gzip_ok else html, mimetype="text/html", headers=html_headers(gzip_ok)
+        )
+
+    page = stream_dashboard(cache_key, version, gzip_ok, **context)
+    # Stream the page so the browser can start on the head while rows render
+    return Response(page, mimetype="text/html", headers=html_headers(gzip_ok))
 
 
 # On Vercel, the `app` object is used as the WSGI entrypoint.
@@ -1,16 +1,38 @@
 import os
+import re
 import json
-from datetime import datetime
-
+import gzip
+import hashlib
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from threading import Lock
+
+import numpy as np
+import orjson
 import pandas as pd
+from cachetools import TTLCache
+from jinja2 import DictLoader, Environment
+from markupsafe import Markup, escape
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Copy-on-Write lets us assign columns on slices without defensive .copy()
+# calls. It is always enabled from pandas 3.0 onwards.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
 
 # Spreadsheet IDs
 # Starlink activation status source (new sheet)
 SPREADSHEET_ID_STARLINK = "1XdByRZ3zYX5pfqEoufLXb3qnPTIh2rBmnfl4JzWoEbQ"
 # Main schedule / outcome data
 SPREADSHEET_ID_MAIN = "1zchK5za6LM5aj91s4KDn-CCgNJ5vQFDsCk_ov4XsSn4"
+# Sheets the dashboard is built from, in get_table_data's load order
+_DASHBOARD_SHEETS = [(SPREADSHEET_ID_STARLINK, "Master"), (SPREADSHEET_ID_MAIN, "Master")]
+
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/spreadsheets"
 
 # Column names with line breaks in headers (as in the Sheets)
 SCHEDULE_COL = "Schedule of Delivery/\\nInstallation\\n(Start Date)".replace("\\n", "\n")
@@ -18,9 +40,88 @@ SCHEDULE_END_COL = "Schedule of Delivery/\\nInstallation\\n(End Date)".replace("
 OUTCOME_COL = "Outcome Status \\n (to be Accomplished by Supplier)".replace("\\n", "\n")
 BLOCKER_COL = "Blocker \\n (to be Accomplished by Supplier)".replace("\\n", "\n")
 
-
-def _build_sheets_service():
-    """Build Google Sheets service, using env var JSON if available."""
+# Main-sheet text columns with only a handful of distinct values
+_CATEGORY_COLS = (
+    "Region",
+    "Division",
+    "Province",
+    OUTCOME_COL,
+    "Status of Calendar",
+    "Final Status",
+    "Validated?",
+)
+
+# Lot # filter: each lot covers a fixed set of regions
+_LOT_MAP: dict[str, frozenset[str]] = {
+    "Lot #1": frozenset({
+        "Region I",
+        "Region II",
+        "Region III",
+        "Region IV-A",
+        "Region IV-B",
+        "MIMAROPA",
+        "Region V",
+        "CAR",
+    }),
+    "Lot #2": frozenset({
+        "Region VI",
+        "Region VII",
+        "Region VIII",
+        "NIR",
+    }),
+    "Lot #3": frozenset({
+        "Region IX",
+        "Region X",
+        "Region XI",
+        "Region XII",
+        "Region CARAGA",
+    }),
+}
+
+# Table rows rendered per page load / scroll fetch, and the estimated
+# height of one row used to size the placeholder for rows not yet loaded
+PAGE_SIZE = 200
+ROW_HEIGHT_PX = 24
+
+# Keys of each dashboard row returned by get_table_data, in display order
+ROW_COLUMNS = [
+    "Region",
+    "Division",
+    "Province",
+    "BEIS School ID",
+    "Schedule",
+    "Calendar Status",
+    "Start Time",
+    "End Time",
+    "Installation Status",
+    "Starlink Status",
+    "Approval",
+    "Final Status",
+    "Validated?",
+    "Blocker",
+]
+
+# Cells of each table row, in the order _ROW_TMPL numbers them
+_ROW_CELLS = (
+    "Region",
+    "Division",
+    "Province",
+    "BEIS School ID",
+    "Schedule",
+    "Calendar Status",
+    "Start Time",
+    "End Time",
+    "Installation Status",
+    "Starlink Status",
+    "Approval",
+    "Final Status",
+    "Validated?",
+    "_row_class",
+)
+
+
+def _build_credentials() -> Credentials:
+    """Load service account credentials, using env var JSON if available."""
     json_env = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
     if json_env:
         # Be forgiving if the value was pasted with surrounding quotes
@@ -39,64 +140,334 @@ def _build_sheets_service():
             service_account_file,
             scopes=["https://www.googleapis.com/auth/spreadsheets.readonly"],
         )
-    return build("sheets", "v4", credentials=creds)
+    return creds
 
 
-_sheets_service = _build_sheets_service()
+def _build_sheets_session() -> AuthorizedSession:
+    """Build a pooled, retrying HTTP session authorized for the Sheets API."""
+    session = AuthorizedSession(_credentials)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Explicit schedule date formats we expect to see, grouped by a cheap regex
+# on the value's shape so each value only attempts the formats it could
+# match. Within a group, formats are tried in order (MM/DD before DD/MM).
+_SCHEDULE_FORMATS = [
+    (
+        re.compile(r"^[A-Za-z]+\s+\s?\d{1,2},\s+\d{4}$"),
+        ("%b %d, %Y", "%B %d, %Y"),      # Feb 05, 2026 / February 17, 2026
+    ),
+    (
+        re.compile(r"^[A-Za-z]+\.\s+\s?\d{1,2},\s+\d{4}$"),
+        ("%b. %d, %Y",),                  # Feb. 05, 2026
+    ),
+    (
+        re.compile(r"^\s?\d{1,2}-[A-Za-z]+-\d{2}$"),
+        ("%d-%b-%y",),                    # 05-Feb-26
+    ),
+    (
+        re.compile(r"^\s?\d{1,2}-[A-Za-z]+-\d{4}$"),
+        ("%d-%b-%Y",),                    # 05-Feb-2026
+    ),
+    (
+        re.compile(r"^\s?\d{1,2}/\s?\d{1,2}/\d{2}$"),
+        ("%m/%d/%y", "%d/%m/%y"),         # 02/04/26 (MM/DD/YY, then DD/MM/YY)
+    ),
+    (
+        re.compile(r"^\s?\d{1,2}/\s?\d{1,2}/\d{4}$"),
+        ("%m/%d/%Y", "%d/%m/%Y"),         # 02/04/2026
+    ),
+]
+
+
+_credentials = _build_credentials()
+# One keep-alive session shared by all requests (and fetch threads), so
+# repeat Sheets calls reuse pooled TLS connections.
+_sheets_session = _build_sheets_session()
+
+# Sheets from different spreadsheets are fetched in parallel
+_FETCH_POOL = ThreadPoolExecutor(max_workers=2)
+
+# Rendered dashboard pages, keyed by (request args, sheet version).
+# The version is the content digests of the sheets a page was rendered
+# from, so a refresh that sees new data makes every older page
+# unreachable. Pages live just under the page's 5-minute auto-refresh so
+# each refresh of an already-viewed filter set is a cache hit.
+HTML_MAX_AGE = 290
+_HTML_CACHE = TTLCache(maxsize=64, ttl=HTML_MAX_AGE)
+_HTML_CACHE_LOCK = Lock()
+
+# (parsed sheet, content digest) keyed by (spreadsheet_id, sheet_name).
+# Entries live for the page's 5-minute auto-refresh so repeat hits skip the
+# Sheets API round-trip.
+_SHEET_CACHE = TTLCache(maxsize=8, ttl=300)
+_SHEET_CACHE_LOCK = Lock()
+
+# Merged/parsed/sorted base frame keyed by the loaded sheets' content
+# digests, so requests that only change filters skip the merge, date
+# parsing and sort.
+_MERGED_CACHE = TTLCache(maxsize=2, ttl=300)
+_MERGED_CACHE_LOCK = Lock()
+
+# get_table_data results keyed by (sheet digests, filter args)
+_TABLE_DATA_CACHE = TTLCache(maxsize=256, ttl=60)
+_TABLE_DATA_CACHE_LOCK = Lock()
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether the client's Accept-Encoding header allows a gzip body.
+
+    Codings are matched as whole tokens with their q-values, so
+    ``gzip;q=0`` refuses gzip, and ``*`` only allows it when gzip is not
+    listed itself.
+    """
+    weights = {}
+    for item in (accept_encoding or "").split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    for coding in ("gzip", "x-gzip"):
+        if coding in weights:
+            return weights[coding] > 0
+    return weights.get("*", 0) > 0
+
+
+def html_headers(gzip_ok: bool) -> dict[str, str]:
+    """Response headers for a page, card or NDJSON body that may have been gzipped."""
+    headers = {
+        "Vary": "Accept-Encoding",
+        # These bodies follow the live sheets (and the card's version must
+        # match its NDJSON windows), so nothing may reuse them without
+        # asking; _HTML_CACHE keeps the re-request cheap. Only the
+        # content-hashed assets are cached long-term (ASSET_HEADERS).
+        "Cache-Control": "private, no-cache",
+    }
+    if gzip_ok:
+        headers["Content-Encoding"] = "gzip"
+    return headers
+
+
+def get_cached_html(key, version, gzip_ok: bool = False):
+    """Return the page cached for these args and sheet version (gzipped if gzip_ok), or None."""
+    with _HTML_CACHE_LOCK:
+        entry = _HTML_CACHE.get((key, version))
+    if entry is None:
+        return None
+    html, compressed = entry
+    return compressed if gzip_ok else html
+
+
+def cache_html(key, version, html: str, compressed: bytes | None = None) -> bytes:
+    """Remember a page rendered from this sheet version, with its gzip body.
+
+    Pollers on the 5-minute refresh then reuse the compressed bytes instead
+    of re-compressing. Returns the gzip body.
+    """
+    if compressed is None:
+        compressed = gzip.compress(html.encode("utf-8"), compresslevel=6)
+    with _HTML_CACHE_LOCK:
+        _HTML_CACHE[(key, version)] = (html, compressed)
+    return compressed
+
+
+def sheet_version():
+    """Return the version of the dashboard sheets as currently loaded.
+
+    Matches the version get_table_data returns for the same data, so pages
+    can be looked up before any filtering is done.
+    """
+    return _load_many(_DASHBOARD_SHEETS)[1]
+
+
+def version_token(version) -> str:
+    """The sheet version as the string the card carries and NDJSON requests send back."""
+    return "-".join(version)
+
+
+def _load_many(
+    pairs: list[tuple[str, str]],
+) -> tuple[dict[tuple[str, str], pd.DataFrame], tuple[str, ...]]:
+    """Load several (spreadsheet_id, sheet_name) sheets, one batchGet per spreadsheet.
+
+    Also returns the content digests of exactly the frames returned, in
+    ``pairs`` order, so callers can key caches by the data they were given
+    rather than by whatever a concurrent fetch has stored since.
+    """
+    frames = {}
+    digests = {}
+    missing: dict[str, list[str]] = {}
+    with _SHEET_CACHE_LOCK:
+        for key in pairs:
+            entry = _SHEET_CACHE.get(key)
+            if entry is None:
+                missing.setdefault(key[0], []).append(key[1])
+            else:
+                frames[key], digests[key] = entry
+    futures = {
+        spreadsheet_id: _FETCH_POOL.submit(_fetch_many, spreadsheet_id, sheet_names)
+        for spreadsheet_id, sheet_names in missing.items()
+    }
+    for spreadsheet_id, sheet_names in missing.items():
+        fetched = futures[spreadsheet_id].result()
+        with _SHEET_CACHE_LOCK:
+            for sheet_name, entry in zip(sheet_names, fetched):
+                _SHEET_CACHE[(spreadsheet_id, sheet_name)] = entry
+                frames[(spreadsheet_id, sheet_name)], digests[(spreadsheet_id, sheet_name)] = entry
+    # Shallow copies so callers can rename/add columns without touching the cache
+    return (
+        {key: frames[key].copy(deep=False) for key in pairs},
+        tuple(digests[key] for key in pairs),
+    )
+
 
+def _fetch_many(spreadsheet_id: str, sheet_names: list[str]) -> list[tuple[pd.DataFrame, str]]:
+    """Fetch sheets of one spreadsheet from the Sheets API in a single request.
 
-def _load_df(spreadsheet_id: str, sheet_name: str) -> pd.DataFrame:
-    """Generic loader for a given sheet."""
-    result = (
-        _sheets_service.spreadsheets()
-        .values()
-        .get(spreadsheetId=spreadsheet_id, range=f"'{sheet_name}'!A1:ZZ")
-        .execute()
+    Returns a (frame, content digest) pair per sheet.
+    """
+    resp = _sheets_session.get(
+        f"{SHEETS_API_URL}/{spreadsheet_id}/values:batchGet",
+        params={"ranges": [f"'{name}'!A1:ZZ" for name in sheet_names]},
+        timeout=30,
     )
-    values = result.get("values", [])
+    resp.raise_for_status()
+    result = orjson.loads(resp.content)
+    value_ranges = result.get("valueRanges", [])
+    frames = []
+    for i, sheet_name in enumerate(sheet_names):
+        values = value_ranges[i].get("values", []) if i < len(value_ranges) else []
+        # Stable across processes, so every worker gives the same data the
+        # same version
+        digest = hashlib.sha1(orjson.dumps(values)).hexdigest()[:12]
+        frames.append((_values_to_df(values), digest))
+    return frames
+
+
+def _values_to_df(values: list[list[str]]) -> pd.DataFrame:
+    """Build a DataFrame from a Sheets values array (first row is the header)."""
     if not values:
         return pd.DataFrame()
 
     header, *rows = values
     cols_len = len(header)
-    normalized_rows = []
-    for r in rows:
-        if len(r) < cols_len:
-            r = r + [""] * (cols_len - len(r))
-        elif len(r) > cols_len:
-            r = r[:cols_len]
-        normalized_rows.append(r)
-    return pd.DataFrame(normalized_rows, columns=header)
-
-
-def load_starlink_df() -> pd.DataFrame:
-    """Load BEIS School ID + activation status from the activation sheet."""
-    df = _load_df(SPREADSHEET_ID_STARLINK, "Master")
+    # Copy ragged rows into one preallocated grid: short rows keep the ""
+    # fill value, long rows are truncated to the header width.
+    grid = np.full((len(rows), cols_len), "", dtype=object)
+    for i, r in enumerate(rows):
+        r = r[:cols_len]
+        grid[i, : len(r)] = r
+    return pd.DataFrame(grid, columns=header)
+
+
+def _parse_unique(s: pd.Series, fmt: str) -> pd.Series:
+    """Parse a repetitive text column by converting only its distinct values."""
+    uniques, inverse = np.unique(s.fillna("").astype(str).to_numpy(), return_inverse=True)
+    parsed = pd.to_datetime(pd.Index(uniques), format=fmt, errors="coerce")
+    return pd.Series(parsed.to_numpy()[inverse], index=s.index)
+
+
+def _parse_schedule_vec(s: pd.Series) -> pd.Series:
+    """Parse schedule dates for a whole column with a per-format cascade.
+
+    Each distinct value is run through the formats whose shape it matches
+    (one vectorized pd.to_datetime call per format), and anything still
+    unparsed falls back to pandas' generic parser.
+    """
+    text = s.fillna("").astype(str).str.strip()
+    codes, uniques = pd.factorize(text)
+    values = pd.Series(uniques, dtype=object)
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[us]")
+    for pattern, fmts in _SCHEDULE_FORMATS:
+        shaped = values.str.match(pattern)
+        for fmt in fmts:
+            todo = shaped & parsed.isna()
+            if todo.any():
+                parsed[todo] = pd.to_datetime(values[todo], format=fmt, errors="coerce")
+    todo = values.ne("") & parsed.isna()
+    if todo.any():
+        # utc=True so stray timezone-suffixed values cannot fail the whole column
+        fallback = pd.to_datetime(values[todo], format="mixed", errors="coerce", utc=True)
+        parsed[todo] = fallback.dt.tz_localize(None)
+    return pd.Series(parsed.to_numpy()[codes], index=s.index)
+
+
+def _strip_category(s: pd.Series) -> pd.Series:
+    """Strip a repetitive text column and return it as a categorical.
+
+    Only the distinct values are stripped; values that collapse to the same
+    text after stripping share one category.
+    """
+    codes, uniques = pd.factorize(s.fillna("").astype(str))
+    stripped = pd.Index(uniques).str.strip()
+    categories = stripped.unique().sort_values()
+    return pd.Series(
+        pd.Categorical.from_codes(categories.get_indexer(stripped)[codes], categories=categories),
+        index=s.index,
+    )
+
+
+def _clean_starlink_df(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the cleaned BEIS School ID + activation columns of the raw sheet."""
     required = ["BEIS School ID", "Status of Activation", "Approval (Accepted / Decline) "]
     if df.empty or any(col not in df.columns for col in required):
         return pd.DataFrame(columns=required)
 
-    df = df[required].copy()
+    df = df[required]
     # Drop duplicate "Status of Activation" columns, keep the first
     df = df.loc[:, ~df.columns.duplicated()]
     df["BEIS School ID"] = df["BEIS School ID"].astype(str).str.strip()
+    # Status columns use the pandas string dtype (Arrow-backed when pyarrow
+    # is installed), stripped once here so the stats code only lowercases.
     df["Status of Activation"] = (
-        df["Status of Activation"].fillna("").astype(str).str.strip()
+        df["Status of Activation"].fillna("").astype("string").str.strip()
     )
     df["Approval (Accepted / Decline) "] = (
-        df["Approval (Accepted / Decline) "].fillna("").astype(str).str.strip()
+        df["Approval (Accepted / Decline) "].fillna("").astype("string").str.strip()
     )
 
-    # In case of duplicates, keep the last occurrence
-    df = df.replace({"": pd.NA}).dropna(subset=["BEIS School ID"]).drop_duplicates(
-        subset=["BEIS School ID"], keep="last"
-    )
+    # Skip rows without an ID; in case of duplicates, keep the last occurrence
+    df = df.loc[df["BEIS School ID"].ne("")]
+    df = df.drop_duplicates(subset=["BEIS School ID"], keep="last")
     return df
 
 
-def load_main_df() -> pd.DataFrame:
-    """Load main schedule/outcome data from the second sheet."""
-    df = _load_df(SPREADSHEET_ID_MAIN, "Master")
+def _filter_options(df: pd.DataFrame) -> dict[str, list[str]]:
+    """Distinct non-blank values for each filter dropdown of the main sheet.
+
+    Options come from the full sheet so they do not shrink as filters are
+    applied; the categorical columns already hold them sorted and unique.
+    """
+    def _values(col: str) -> list[str]:
+        if df.empty or col not in df.columns:
+            return []
+        return [v for v in df[col].cat.categories if v.strip()]
+
+    return {
+        "region": _values("Region"),
+        "installation": _values(OUTCOME_COL),
+        "final": _values("Final Status"),
+        "validated": _values("Validated?"),
+    }
+
+
+def _clean_main_df(df: pd.DataFrame) -> tuple[pd.DataFrame, dict[str, list[str]]]:
+    """Normalize headers and clean the core columns of the raw main sheet."""
 
     # In this sheet, the first column header is blank but contains Region values.
     # Normalize that header to "Region" so we can work with it.
@@ -123,78 +494,91 @@ def load_main_df() -> pd.DataFrame:
         "Status of Calendar",
     ]
     if df.empty or any(col not in df.columns for col in required):
-        return pd.DataFrame(columns=required)
+        df = pd.DataFrame(columns=required)
+        return df, _filter_options(df)
 
     # Always treat column B (index 1) as Division, regardless of header.
     # This matches the current layout of the master sheet.
     if not df.empty and df.shape[1] > 1:
-        df["Division"] = df.iloc[:, 1].astype(str).str.strip()
+        df["Division"] = df.iloc[:, 1].astype(str)
     else:
         df["Division"] = ""
 
     # Optional columns that we show if present (e.g., Division, Final Status, Validated?)
     optional = ["Division", "Final Status", "Validated?"]
     cols = required + [c for c in optional if c in df.columns]
-    df = df[cols].copy()
+    df = df[cols]
 
-    # Clean up core text fields
-    for col in ["Region", "Division", "Province", "BEIS School ID"]:
+    # Low-cardinality text columns become categoricals, so comparisons, isin
+    # and sorting work on small integer codes; they are stripped through
+    # their distinct values only.
+    for col in _CATEGORY_COLS:
         if col in df.columns:
-            df[col] = df[col].astype(str).str.strip()
+            df[col] = _strip_category(df[col])
 
-    # Clean schedule, outcome, blocker
-    df[SCHEDULE_COL] = df[SCHEDULE_COL].fillna("").astype(str).str.strip()
-    df[SCHEDULE_END_COL] = df[SCHEDULE_END_COL].fillna("").astype(str).str.strip()
-    df[OUTCOME_COL] = df[OUTCOME_COL].fillna("").astype(str).str.strip()
-    df[BLOCKER_COL] = df[BLOCKER_COL].fillna("").astype(str).str.strip()
-    df["Status of Calendar"] = df["Status of Calendar"].fillna("").astype(str).str.strip()
-    df[BLOCKER_COL] = df[BLOCKER_COL].fillna("").astype(str).str.strip()
+    # Strip the remaining free-text fields in one batch
+    text_cols = ["BEIS School ID", SCHEDULE_COL, SCHEDULE_END_COL, BLOCKER_COL]
+    df[text_cols] = df[text_cols].fillna("").apply(lambda s: s.astype(str).str.strip())
 
     # Do not drop rows with blank schedule here; keep full data set.
     # The main view can choose to filter out unscheduled rows, while
     # an alternate "full" mode can include everything.
-    return df
-
-
-def get_table_data(
-      selected_region: str | None = None,
-      selected_schedule=None,
-      selected_installation: str | None = None,
-      selected_tile: str | None = None,
-      selected_lot: str | None = None,
-      selected_final: str | None = None,
-      selected_validated: str | None = None,
-      include_unscheduled: bool = False,
-      selected_search: str | None = None,
-  ):
-    """Return rows, filter options, and stats for the dashboard."""
-    df_main = load_main_df()
+    return df, _filter_options(df)
+
+
+def _sort_order(df: pd.DataFrame) -> np.ndarray:
+    """Row order by schedule date, start/end time, region, province and school ID.
+
+    Matches a stable multi-column sort_values (missing dates last), but sorts
+    integer keys with one np.lexsort: dates as int64, text as sorted codes.
+    """
+    def _date_key(col: str) -> np.ndarray:
+        s = df[col]
+        return np.where(s.isna(), np.iinfo(np.int64).max, s.to_numpy().view("i8"))
+
+    def _text_key(col: str) -> np.ndarray:
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            return s.cat.codes.to_numpy()
+        return pd.factorize(s, sort=True)[0]
+
+    # np.lexsort treats the last key as the primary one
+    return np.lexsort([
+        _text_key("BEIS School ID"),
+        _text_key("Province"),
+        _text_key("Region"),
+        _date_key("End_sort"),
+        _date_key("Start_sort"),
+        _date_key("Schedule_sort"),
+    ])
+
+
+def _prepare_merged(star_raw: pd.DataFrame, main_raw: pd.DataFrame):
+    """Merge, parse and sort both sheets into the dashboard's base frame.
+
+    Returns (df, options, schedule_options), or None when the main sheet is
+    empty. The result only depends on the sheet contents, so it is cached
+    per sheet version and every request just filters it.
+    """
+    df_main, options = _clean_main_df(main_raw)
     if df_main.empty:
-        return [], [], [], [], [], [], {
-            "active": False,
-            "star_activated": 0,
-            "star_not_activated": 0,
-            "approval_accepted": 0,
-            "approval_pending": 0,
-            "approval_decline": 0,
-            "calendar_sent": 0,
-            "calendar_not_sent": 0,
-            "s1_success": 0,
-            "scheduled": 0,
-            "unscheduled": 0,
-        }
+        return None
 
-    df_star = load_starlink_df()
+    df_star = _clean_starlink_df(star_raw)
 
-    # Join Starlink activation status by BEIS School ID
-    if not df_star.empty:
-        df_merged = df_main.merge(
-            df_star, on="BEIS School ID", how="left", suffixes=("", "_starlink")
-        )
-        df_merged["Starlink Status"] = df_merged["Status of Activation"]
-    else:
-        df_merged = df_main.copy()
-        df_merged["Starlink Status"] = ""
+    # Attach Starlink activation/approval by BEIS School ID (IDs are unique
+    # in df_star, so a keyed lookup replaces a full merge)
+    star_idx = df_star.set_index("BEIS School ID")
+    df_merged = df_main
+    df_merged["Starlink Status"] = (
+        df_main["BEIS School ID"]
+        .map(star_idx["Status of Activation"])
+        .fillna("")
+        .astype("category")
+    )
+    df_merged["Approval (Accepted / Decline) "] = (
+        df_main["BEIS School ID"].map(star_idx["Approval (Accepted / Decline) "]).fillna("")
+    )
 
     # Installation Status derived from Outcome Status (for now, just mirror it)
     df_merged["Installation Status"] = df_merged[OUTCOME_COL]
@@ -210,7 +594,10 @@ def get_table_data(
         return "Invite Not Sent"
 
     if "Status of Calendar" in df_merged.columns:
-        df_merged["Calendar Status"] = df_merged["Status of Calendar"].apply(_map_calendar_status)
+        # Mapping a categorical only evaluates each distinct value once
+        df_merged["Calendar Status"] = (
+            df_merged["Status of Calendar"].map(_map_calendar_status).astype("category")
+        )
     else:
         df_merged["Calendar Status"] = ""
 
@@ -218,197 +605,188 @@ def get_table_data(
     df_merged["Schedule"] = df_merged[SCHEDULE_COL].fillna("").astype(str).str.strip()
     df_merged["Schedule_end_raw"] = df_merged[SCHEDULE_END_COL].fillna("").astype(str).str.strip()
 
-    # For sorting, parse schedule as a date where possible with several formats
-    def _parse_schedule(val: str):
-        val = (val or "").strip()
-        if not val:
-            return pd.NaT
-        # Explicit formats we expect to see
-        fmts = [
-            "%b %d, %Y",      # Feb 05, 2026
-            "%b. %d, %Y",     # Feb. 05, 2026
-            "%B %d, %Y",      # February 17, 2026
-            "%d-%b-%y",       # 05-Feb-26
-            "%d-%b-%Y",       # 05-Feb-2026
-            "%m/%d/%y",       # 02/04/26 (MM/DD/YY)
-            "%m/%d/%Y",       # 02/04/2026
-            "%d/%m/%y",       # 04/02/26 (DD/MM/YY)
-            "%d/%m/%Y",       # 04/02/2026
-        ]
-        for fmt in fmts:
-            try:
-                return datetime.strptime(val, fmt)
-            except Exception:
-                continue
-        # Fallback to pandas parser
-        try:
-            return pd.to_datetime(val, errors="raise")
-        except Exception:
-            return pd.NaT
-
-    df_merged["Schedule_sort"] = df_merged["Schedule"].apply(_parse_schedule)
+    # For sorting, parse schedule start/end as dates where possible
+    df_merged["Schedule_sort"] = _parse_schedule_vec(df_merged["Schedule"])
+    df_merged["Schedule_end_sort"] = _parse_schedule_vec(df_merged["Schedule_end_raw"])
     # Parse times for better ordering within a day
-    df_merged["Start_sort"] = pd.to_datetime(
-        df_merged["Start Time"], errors="coerce", format="%I:%M %p"
+    df_merged["Start_sort"] = _parse_unique(df_merged["Start Time"], "%I:%M %p")
+    df_merged["End_sort"] = _parse_unique(df_merged["End Time"], "%I:%M %p")
+
+    # Build a consistent display string for schedule dates, e.g. "Feb. 02, 2026 - Feb. 05, 2026".
+    # Unparseable dates keep their raw text; a missing end date shows as "-".
+    start_text = (
+        df_merged["Schedule_sort"].dt.strftime("%b. %d, %Y").fillna(df_merged["Schedule"])
     )
-    df_merged["End_sort"] = pd.to_datetime(
-        df_merged["End Time"], errors="coerce", format="%I:%M %p"
+    end_text = (
+        df_merged["Schedule_end_sort"]
+        .dt.strftime("%b. %d, %Y")
+        .fillna(df_merged["Schedule_end_raw"])
+        .mask(df_merged["Schedule_end_raw"].eq(""), "-")
     )
-
-    # Build a consistent display string for schedule dates, e.g. "Feb. 02, 2026 - Feb. 05, 2026"
-    def _format_schedule(row):
-        ts_start = row.get("Schedule_sort")
-        start_raw = row["Schedule"]
-        # Format start date
-        if pd.notna(ts_start):
-            try:
-                start_text = ts_start.strftime("%b. %d, %Y")
-            except Exception:
-                start_text = start_raw
-        else:
-            start_text = start_raw
-
-        # Format end date
-        end_raw = row.get("Schedule_end_raw", "") or ""
-        end_raw = str(end_raw).strip()
-        if not end_raw:
-            end_text = "-"
-        else:
-            ts_end = _parse_schedule(end_raw)
-            if pd.notna(ts_end):
-                try:
-                    end_text = ts_end.strftime("%b. %d, %Y")
-                except Exception:
-                    end_text = end_raw
-            else:
-                end_text = end_raw
-
-        if not start_text:
-            return ""
-        return f"{start_text} - {end_text}"
-
-    df_merged["Schedule_display"] = df_merged.apply(_format_schedule, axis=1)
-
-    # In the default view we only consider rows with a schedule.
-    # In "full" mode we keep unscheduled rows as well.
-    if not include_unscheduled:
-        df_merged = df_merged[df_merged["Schedule"] != ""].copy()
-
-    # Sort by earliest schedule date, then start/end time, then by region/province/school
-    df_sorted = df_merged.sort_values(
-        by=["Schedule_sort", "Start_sort", "End_sort", "Region", "Province", "BEIS School ID"],
-        kind="stable",
+    df_merged["Schedule_display"] = np.where(
+        start_text.eq(""), "", start_text + " - " + end_text
     )
 
-    # Optional Lot # filter (maps lot to a set of regions)
-    lot_map = {
-        "Lot #1": {
-            "Region I",
-            "Region II",
-            "Region III",
-            "Region IV-A",
-            "Region IV-B",
-            "MIMAROPA",
-            "Region V",
-            "CAR",
-        },
-        "Lot #2": {
-            "Region VI",
-            "Region VII",
-            "Region VIII",
-            "NIR",
-        },
-        "Lot #3": {
-            "Region IX",
-            "Region X",
-            "Region XI",
-            "Region XII",
-            "Region CARAGA",
-        },
-    }
-    lot = (selected_lot or "").strip()
-    if lot in lot_map:
-        allowed_regions = lot_map[lot]
-        df_sorted = df_sorted[df_sorted["Region"].isin(allowed_regions)]
-
-    # All distinct regions for filter options
-    region_options = sorted(
-        r for r in df_sorted["Region"].astype(str).unique() if r.strip()
-    )
     # All distinct schedule display values for filter options, ordered by date
     sched_unique = (
-        df_sorted[["Schedule_display", "Schedule_sort"]]
+        df_merged[["Schedule_display", "Schedule_sort"]]
         .drop_duplicates()
         .sort_values(["Schedule_sort", "Schedule_display"])
     )
     schedule_options = [s for s in sched_unique["Schedule_display"].tolist() if s]
 
-    # All distinct installation statuses for filter options
-    inst_unique = (
-        df_sorted["Installation Status"]
-        .fillna("")
-        .astype(str)
-        .str.strip()
-        .replace("", pd.NA)
-        .dropna()
-        .unique()
+    # Lowercased status text for the stats tiles, computed once per sheet version
+    for col, key in [
+        ("Starlink Status", "_star_lc"),
+        ("Approval (Accepted / Decline) ", "_appr_lc"),
+        ("Calendar Status", "_cal_lc"),
+        ("Installation Status", "_inst_lc"),
+    ]:
+        df_merged[key] = df_merged[col].astype("string").fillna("").str.strip().str.lower()
+
+    # Row highlight class: declined approvals are critical, anything not
+    # activated on Starlink is a warning
+    star_ok = df_merged["_star_lc"].eq("activated").to_numpy(dtype=bool)
+    declined = df_merged["_appr_lc"].str.contains("declin", regex=False).to_numpy(dtype=bool)
+    df_merged["_row_class"] = pd.Categorical(
+        np.where(declined, "row-critical", np.where(star_ok, "", "row-warning"))
     )
-    installation_options = sorted(inst_unique.tolist())
-
-    # All distinct Final Status values for filter options
-    if "Final Status" in df_sorted.columns:
-        final_unique = (
-            df_sorted["Final Status"]
-            .fillna("")
-            .astype(str)
-            .str.strip()
-            .replace("", pd.NA)
-            .dropna()
-            .unique()
+
+    # Sort by earliest schedule date, then start/end time, then by region/province/school.
+    # np.lexsort is stable, so later row filters keep this order.
+    df_merged = df_merged.iloc[_sort_order(df_merged)]
+    return df_merged, options, schedule_options
+
+
+def get_table_data(
+      selected_region: str | None = None,
+      selected_schedule=None,
+      selected_installation: str | None = None,
+      selected_tile: str | None = None,
+      selected_lot: str | None = None,
+      selected_final: str | None = None,
+      selected_validated: str | None = None,
+      include_unscheduled: bool = False,
+      selected_search: str | None = None,
+  ):
+    """Return rows, filter options, stats and the sheet version for the dashboard.
+
+    The version is the content digests of the sheets loaded here, so the
+    caches below and anything rendered from the result are keyed by the
+    data actually used.
+    """
+    sheets, version = _load_many(_DASHBOARD_SHEETS)
+    with _MERGED_CACHE_LOCK:
+        prepared = _MERGED_CACHE.get(version)
+    if prepared is None:
+        prepared = _prepare_merged(
+            sheets[(SPREADSHEET_ID_STARLINK, "Master")], sheets[(SPREADSHEET_ID_MAIN, "Master")]
         )
-        final_status_options = sorted(final_unique.tolist())
-    else:
-        final_status_options = []
-
-    # All distinct Validated? values for filter options
-    if "Validated?" in df_sorted.columns:
-        val_unique = (
-            df_sorted["Validated?"]
-            .fillna("")
-            .astype(str)
-            .str.strip()
-            .replace("", pd.NA)
-            .dropna()
-            .unique()
+        with _MERGED_CACHE_LOCK:
+            _MERGED_CACHE[version] = prepared
+    if prepared is None:
+        return {col: [] for col in (*ROW_COLUMNS, *_ROW_CELLS)}, [], [], [], [], [], {
+            "active": False,
+            "star_activated": 0,
+            "star_not_activated": 0,
+            "approval_accepted": 0,
+            "approval_pending": 0,
+            "approval_decline": 0,
+            "calendar_sent": 0,
+            "calendar_not_sent": 0,
+            "s1_success": 0,
+            "scheduled": 0,
+            "unscheduled": 0,
+        }, version
+
+    # Scroll requests and auto-refreshes repeat the same filters; reuse
+    # their rows and counts while the sheets are unchanged
+    key = (
+        version,
+        selected_region,
+        tuple(selected_schedule) if isinstance(selected_schedule, (list, tuple, set)) else selected_schedule,
+        selected_installation,
+        selected_tile,
+        selected_lot,
+        selected_final,
+        selected_validated,
+        include_unscheduled,
+        selected_search,
+    )
+    with _TABLE_DATA_CACHE_LOCK:
+        result = _TABLE_DATA_CACHE.get(key)
+    if result is None:
+        result = _filter_table_data(
+            prepared,
+            selected_region,
+            selected_schedule,
+            selected_installation,
+            selected_tile,
+            selected_lot,
+            selected_final,
+            selected_validated,
+            include_unscheduled,
+            selected_search,
         )
-        validated_options = sorted(val_unique.tolist())
-    else:
-        validated_options = []
+        with _TABLE_DATA_CACHE_LOCK:
+            _TABLE_DATA_CACHE[key] = result
+    return (*result, version)
+
+
+def _filter_table_data(
+      prepared,
+      selected_region,
+      selected_schedule,
+      selected_installation,
+      selected_tile,
+      selected_lot,
+      selected_final,
+      selected_validated,
+      include_unscheduled,
+      selected_search,
+  ):
+    """Filter the prepared frame and build rows, options and stats from it."""
+    df_cached, options, schedule_options = prepared
+    # Shallow copy so the filters below never write into the cached frame
+    df_sorted = df_cached.copy(deep=False)
+
+    # Row filters are combined into one boolean mask and applied in a single
+    # copy. In the default view we only consider rows with a schedule;
+    # "full" mode keeps unscheduled rows as well.
+    mask = np.ones(len(df_sorted), dtype=bool)
+    if not include_unscheduled:
+        mask &= (df_sorted["Schedule"] != "").to_numpy()
+    allowed_regions = _LOT_MAP.get((selected_lot or "").strip())
+    if allowed_regions:
+        region = df_sorted["Region"]
+        if isinstance(region.dtype, pd.CategoricalDtype):
+            # Membership test on the small integer category codes
+            wanted = region.cat.categories.get_indexer(list(allowed_regions))
+            mask &= np.isin(region.cat.codes.to_numpy(), wanted[wanted >= 0])
+        else:
+            mask &= region.isin(allowed_regions).to_numpy()
 
     # Optional filters
     if selected_region:
-        df_sorted = df_sorted[df_sorted["Region"] == selected_region]
+        mask &= (df_sorted["Region"] == selected_region).to_numpy()
     if selected_schedule:
         if isinstance(selected_schedule, (list, tuple, set)):
-            df_sorted = df_sorted[df_sorted["Schedule_display"].isin(selected_schedule)]
+            mask &= df_sorted["Schedule_display"].isin(selected_schedule).to_numpy()
         else:
-            df_sorted = df_sorted[df_sorted["Schedule_display"] == selected_schedule]
+            mask &= (df_sorted["Schedule_display"] == selected_schedule).to_numpy()
     if selected_installation:
-        # Special value for blank Installation Status
+        # Special value for blank Installation Status (already stripped at load time)
         if selected_installation == "__blank__":
-            df_sorted = df_sorted[
-                df_sorted["Installation Status"]
-                .fillna("")
-                .astype(str)
-                .str.strip()
-                == ""
-            ]
+            mask &= (df_sorted["Installation Status"] == "").to_numpy()
         else:
-            df_sorted = df_sorted[df_sorted["Installation Status"] == selected_installation]
+            mask &= (df_sorted["Installation Status"] == selected_installation).to_numpy()
     if selected_final and "Final Status" in df_sorted.columns:
-        df_sorted = df_sorted[df_sorted["Final Status"] == selected_final]
+        mask &= (df_sorted["Final Status"] == selected_final).to_numpy()
     if selected_validated and "Validated?" in df_sorted.columns:
-        df_sorted = df_sorted[df_sorted["Validated?"] == selected_validated]
+        mask &= (df_sorted["Validated?"] == selected_validated).to_numpy()
+    if not mask.all():
+        df_sorted = df_sorted[mask]
+
     # Free-text search across key columns (supports multiple comma-separated terms)
     if selected_search:
         # Split on commas, trim spaces, ignore empties
@@ -427,18 +805,19 @@ def get_table_data(
                 "Validated?",
                 BLOCKER_COL,
             ]
-            masks = []
-            for col in cols_to_search:
-                if col in df_sorted.columns:
-                    series = df_sorted[col].fillna("").astype(str)
-                    for term in terms:
-                        masks.append(
-                            series.str.contains(term, case=False, na=False)
-                        )
-            if masks:
-                combined = masks[0]
-                for m in masks[1:]:
-                    combined |= m
+            present = [
+                df_sorted[col].fillna("").astype(str)
+                for col in cols_to_search
+                if col in df_sorted.columns
+            ]
+            if present and not df_sorted.empty:
+                # Join the searched columns into one lowercased text per row
+                # (unit-separator delimited so terms cannot span columns),
+                # then scan it once per term instead of once per column.
+                text = present[0].str.cat(present[1:], sep="\x1f").str.lower()
+                combined = np.logical_or.reduce(
+                    [text.str.contains(t.lower(), regex=False).to_numpy() for t in terms]
+                )
                 df_sorted = df_sorted[combined]
 
     # Build stats based on the filtered set (for selected schedule/region)
@@ -457,30 +836,10 @@ def get_table_data(
             "unscheduled": 0,
         }
     else:
-        star_series = (
-            df_sorted["Starlink Status"].fillna("").astype(str).str.strip().str.lower()
-        )
-        appr_series = (
-            df_sorted["Approval (Accepted / Decline) "]
-            .fillna("")
-            .astype(str)
-            .str.strip()
-            .str.lower()
-        )
-        cal_series = (
-            df_sorted.get("Calendar Status", "")
-            .fillna("")
-            .astype(str)
-            .str.strip()
-            .str.lower()
-        )
-        inst_series = (
-            df_sorted["Installation Status"]
-            .fillna("")
-            .astype(str)
-            .str.strip()
-            .str.lower()
-        )
+        star_series = df_sorted["_star_lc"]
+        appr_series = df_sorted["_appr_lc"]
+        cal_series = df_sorted["_cal_lc"]
+        inst_series = df_sorted["_inst_lc"]
 
         # Apply tile-based filter if requested
         tile = (selected_tile or "").strip()
@@ -556,13 +915,6 @@ def get_table_data(
             calendar_not_sent = (cal_series == "invite not sent").sum()
 
             # S1 success count based on Installation Status
-            inst_series = (
-                df_sorted["Installation Status"]
-                .fillna("")
-                .astype(str)
-                .str.strip()
-                .str.lower()
-            )
             s1_success = (inst_series == "s1 - installed (success)").sum()
 
             # Schedule coverage: scheduled vs unscheduled rows in the current view
@@ -589,61 +941,643 @@ def get_table_data(
                 "unscheduled": int(unscheduled),
             }
 
-    rows = []
-    for _, row in df_sorted.iterrows():
-        # Normalize Starlink and approval text
-        star = row["Starlink Status"]
-        if pd.isna(star):
-            star = ""
-        approval_raw = row.get("Approval (Accepted / Decline) ", "")
-        if pd.isna(approval_raw):
-            approval_raw = ""
-        approval_text = str(approval_raw).strip()
-        if not approval_text:
-            # Mirror dashboard behavior: treat blank/None as "Pending"
-            approval_display = "Pending"
-        else:
-            approval_display = approval_text
-
-        # Normalize schedule display to a consistent text format, e.g. "Feb. 02, 2026"
-        schedule_display = row["Schedule"]
-        ts = row.get("Schedule_sort")
-        if pd.notna(ts):
-            try:
-                schedule_display = ts.strftime("%b. %d, %Y")  # e.g. "Feb. 02, 2026"
-            except Exception:
-                # Fallback to original string if formatting fails
-                schedule_display = row["Schedule"]
-        rows.append(
-            {
-                "Region": row["Region"],
-                "Division": row.get("Division", ""),
-                "Province": row["Province"],
-                "BEIS School ID": row["BEIS School ID"],
-                "Schedule": row["Schedule_display"],
-                "Calendar Status": row.get("Calendar Status", ""),
-                "Start Time": row["Start Time"],
-                "End Time": row["End Time"],
-                "Installation Status": row["Installation Status"],
-                "Starlink Status": star,
-                "Approval": approval_display,
-                "Final Status": row.get("Final Status", ""),
-                "Validated?": row.get("Validated?", ""),
-                "Blocker": row[BLOCKER_COL],
-            }
-        )
+    # Assemble display rows column-wise and return them as {column: values}.
+    # Blank approvals mirror the dashboard and show as "Pending".
+    defaults = {
+        col: "" for col in ("Division", "Final Status", "Validated?") if col not in df_sorted.columns
+    }
+    approval = df_sorted.get("Approval (Accepted / Decline) ", pd.Series("", index=df_sorted.index))
+    rows = (
+        df_sorted.assign(
+            **defaults,
+            **{
+                "Schedule": df_sorted["Schedule_display"],
+                "Starlink Status": df_sorted["Starlink Status"].fillna(""),
+                "Approval": approval.fillna("").astype(str).str.strip().replace("", "Pending"),
+                "Blocker": df_sorted[BLOCKER_COL],
+            },
+        )[ROW_COLUMNS]
+        .to_dict(orient="list")
+    )
+
+    # Row highlight class, precomputed with the base frame
+    rows["_row_class"] = df_sorted["_row_class"].tolist()
 
     return (
         rows,
-        region_options,
+        options["region"],
         schedule_options,
-        installation_options,
-        final_status_options,
-        validated_options,
+        options["installation"],
+        options["final"],
+        options["validated"],
         stats,
     )
 
 
+# Static page styles, served from a content-hashed URL so browsers can
+# cache them indefinitely instead of re-downloading them with every page
+STYLESHEET = """
+/* Status gradients shared by tiles, pills and buttons */
+:root {
+    --grad-ok: linear-gradient(135deg, #22c55e, #16a34a);
+    --grad-ok-hover: linear-gradient(135deg, #16a34a, #15803d);
+    --grad-bad: linear-gradient(135deg, #f97373, #dc2626);
+    --grad-warn: linear-gradient(135deg, #facc15, #eab308);
+    --grad-warn-soft: linear-gradient(135deg, #fde68a, #facc15);
+}
+html, body {
+    height: 100%;
+    margin: 0;
+}
+body {
+    font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+    font-size: 12px;
+    background: radial-gradient(circle at top left, #d4e0ff 0, #dde4f0 40%, #d4d4dd 100%);
+    color: #020617;
+    overflow: hidden; /* prevent whole-page scrolling */
+}
+.page {
+    max-width: 1400px;
+    height: 100%;
+    margin: 0 auto;
+    padding: 10px;
+    box-sizing: border-box;
+    display: flex;
+    flex-direction: column;
+}
+h1 {
+    margin: 4px 0 6px 0;
+    font-size: 20px;
+    letter-spacing: 0.08em;
+    text-transform: uppercase;
+    background: linear-gradient(90deg, #0f172a, #0284c7, #0f172a);
+    -webkit-background-clip: text;
+    background-clip: text;
+    color: transparent;
+}
+.meta-line {
+    font-size: 11px;
+    color: #6b7280;
+    margin-bottom: 6px;
+}
+.filter-toggle-bar {
+    display: flex;
+    justify-content: flex-start;
+    margin-bottom: 4px;
+}
+.filter-toggle-btn {
+    border: none;
+    border-radius: 9999px;
+    padding: 4px 10px;
+    font-size: 12px;
+    font-weight: 600;
+    background: linear-gradient(135deg, #0ea5e9, #0369a1);
+    color: #ffffff;
+    cursor: pointer;
+    box-shadow: 0 2px 6px rgba(3, 105, 161, 0.35);
+}
+.filter-toggle-btn:hover {
+    background: linear-gradient(135deg, #0369a1, #075985);
+}
+.filter-container {
+    margin-bottom: 6px;
+}
+.filter-bar {
+    display: flex;
+    align-items: center;
+    gap: 8px;
+    font-size: 12px;
+    padding: 4px 10px;
+    border-radius: 9999px;
+    background: rgba(255, 255, 255, 0.85);
+    box-shadow: 0 6px 18px rgba(15, 23, 42, 0.10);
+}
+.filter-bar label {
+    color: #4b5563;
+    font-weight: 500;
+}
+.filter-bar select {
+    font-size: 12px;
+    padding: 3px 10px;
+    border-radius: 9999px;
+    border: 1px solid rgba(148, 163, 184, 0.7);
+    background-color: #ffffff;
+    color: #111827;
+    box-shadow: 0 2px 6px rgba(15, 23, 42, 0.06);
+    appearance: none;
+}
+.filter-bar select:focus {
+    outline: none;
+    border-color: #38bdf8;
+    box-shadow:
+        0 0 0 1px rgba(56, 189, 248, 0.7),
+        0 4px 10px rgba(56, 189, 248, 0.25);
+}
+.filter-bar select:hover {
+    border-color: #0ea5e9;
+}
+.filter-clear-link {
+    margin-left: 8px;
+    font-size: 11px;
+    font-weight: 500;
+    color: #0ea5e9;
+    text-decoration: none;
+    white-space: nowrap;
+}
+.filter-clear-link:hover {
+    text-decoration: underline;
+}
+.report-bar {
+    margin: 4px 0 8px 0;
+    font-size: 11px;
+    display: flex;
+    justify-content: flex-start;
+}
+.report-trigger-btn {
+    border: none;
+    border-radius: 9999px;
+    padding: 4px 10px;
+    font-size: 11px;
+    font-weight: 600;
+    background: var(--grad-ok);
+    color: #ffffff;
+    cursor: pointer;
+    box-shadow: 0 2px 6px rgba(22, 163, 74, 0.35);
+}
+.report-trigger-btn:hover {
+    background: var(--grad-ok-hover);
+}
+.report-modal-backdrop {
+    position: fixed;
+    inset: 0;
+    background: rgba(15, 23, 42, 0.45);
+    display: none;
+    align-items: center;
+    justify-content: center;
+    z-index: 50;
+}
+.card {
+    background: linear-gradient(135deg, #f9fafb 0%, #e2e8f0 40%, #cbd5f5 100%);
+    border-radius: 10px;
+    box-shadow: 0 18px 44px rgba(15, 23, 42, 0.30);
+    border: 1px solid rgba(71, 85, 105, 0.55);
+    padding: 8px;
+    box-sizing: border-box;
+    flex: 1;                 /* take remaining space below header/meta */
+    display: flex;
+    flex-direction: row;
+    gap: 8px;
+    overflow: hidden;
+}
+.table-wrapper {
+    flex: 3;
+    overflow-y: auto;        /* scroll only table area */
+}
+table {
+    border-collapse: collapse;
+    width: 100%;
+    table-layout: fixed;
+    border: 1px solid #cbd5e1;
+}
+th, td {
+    padding: 2px 4px;
+    text-align: center;
+    font-size: 11px;
+}
+th {
+    border: 1px solid #cbd5e1;
+    background-color: #cbd5f5;
+    font-weight: 600;
+    color: #020617;
+    white-space: normal;           /* allow header text to wrap */
+    word-wrap: break-word;         /* break long tokens like 'Delivery/Installation' */
+    word-break: break-word;
+}
+thead th {
+    position: sticky;
+    top: 0;
+    z-index: 2;
+}
+tbody tr:not(#rows-sentinel) {
+    /* Grid lines are one row border plus a tiled column pattern (the fixed
+       layout gives the 12 columns equal widths) instead of a border per cell */
+    border-bottom: 1px solid #cbd5e1;
+    background-image: repeating-linear-gradient(
+        to right,
+        transparent 0 calc(100% / 12 - 1px),
+        #cbd5e1 calc(100% / 12 - 1px) calc(100% / 12)
+    );
+}
+tbody tr:nth-child(even) {
+    background-color: #f9fafb;
+}
+tbody tr:nth-child(odd) {
+    background-color: #ffffff;
+}
+tbody tr:hover {
+    background-color: #e5f0ff;
+}
+tr.row-warning {
+    background-color: #fef9c3;  /* soft yellow */
+    color: #1f2933;
+}
+tr.row-critical {
+    background-color: #fee2e2;  /* soft red */
+    color: #b91c1c;
+}
+.region-cell {
+    text-align: center;
+    font-weight: 600;
+}
+.school-cell {
+    text-align: center;
+    white-space: normal;
+    word-wrap: break-word;
+}
+.stats-card {
+    flex: 1;
+    max-width: 360px;
+    padding: 6px;
+    background: linear-gradient(135deg, #cbd5f5 0%, #e2e8f0 40%, #f9fafb 100%);
+    border-radius: 10px;
+    box-shadow:
+        0 0 0 1px rgba(71, 85, 105, 0.65),
+        0 20px 50px rgba(15, 23, 42, 0.32);
+    font-size: 12px;
+    overflow-y: auto;
+    overflow-x: hidden;
+    display: flex;
+    flex-direction: column;
+}
+.stats-title {
+    font-weight: 700;
+    margin-bottom: 6px;
+    color: #0f172a;
+    letter-spacing: 0.05em;
+    text-transform: uppercase;
+    text-align: center;
+}
+.stats-main {
+    flex: 1;
+    display: flex;
+    flex-direction: column;
+    gap: 4px;
+    overflow: hidden;
+    /* Tiles and charts skip layout/paint while scrolled out of view (the
+       page scrolls on narrow screens); sized from the last render after that */
+    content-visibility: auto;
+    contain-intrinsic-size: auto 400px;
+}
+.stats-note {
+    font-size: 11px;
+    font-weight: 600;
+    color: #020617;
+    text-align: center;
+    margin-bottom: 8px;
+}
+.stats-filter-note {
+    font-size: 10px;
+    color: #4b5563;
+    text-align: center;
+    margin-bottom: 6px;
+}
+.stats-filter-clear {
+    margin-left: 6px;
+    font-size: 10px;
+    color: #0ea5e9;
+    text-decoration: none;
+}
+.stats-filter-clear:hover {
+    text-decoration: underline;
+}
+.stats-grid {
+    flex: 0 0 auto;
+    display: grid;
+    grid-template-columns: repeat(2, minmax(120px, 1fr)); /* two balanced columns */
+    column-gap: 24px;          /* extra clear space between columns */
+    row-gap: 8px;              /* comfortable vertical spacing */
+    max-width: 340px;          /* slightly wider to keep tiles readable */
+    margin: 0 auto;            /* center grid inside stats card */
+}
+.stats-item {
+    contain: layout paint;    /* tile repaints stay inside the tile */
+    will-change: transform;   /* own compositor layer: gradient + shadow rasterized once */
+    width: 100%;              /* take full cell width */
+    border-radius: 6px;
+    background: #e0e7ff;
+    border: 1px solid rgba(79, 70, 229, 0.8);
+    box-shadow: 0 2px 8px rgba(15, 23, 42, 0.16);
+    padding: 4px 8px;         /* a bit more breathing room */
+    text-align: center;
+}
+.stats-tile-link {
+    display: block;
+    width: 100%;
+    height: 100%;
+    padding: 0;
+    margin: 0;
+    border: none;
+    background: transparent;
+    text-decoration: none;
+    color: inherit;
+    cursor: pointer;
+}
+.stats-label {
+    color: #4b5563;
+    font-size: 9px;
+    line-height: 1.15;
+    text-align: center;
+}
+.stats-value {
+    font-weight: 700;
+    font-size: 11px;
+    line-height: 1.15;
+    color: #0f172a;
+    text-align: center;
+}
+/* Tiles are colored by their stats-ok / stats-warn / stats-bad class; text is white on all of them */
+.stats-item.stats-ok .stats-label,
+.stats-item.stats-ok .stats-value,
+.stats-item.stats-warn .stats-label,
+.stats-item.stats-warn .stats-value,
+.stats-item.stats-bad .stats-label,
+.stats-item.stats-bad .stats-value {
+    color: #ffffff;
+}
+.stats-grid .stats-item.stats-ok {
+    background: var(--grad-ok);  /* green */
+    color: #ffffff;
+}
+.stats-grid .stats-item.stats-warn {
+    background: var(--grad-warn);  /* darker yellow */
+    color: #1f2933;
+}
+.stats-grid .stats-item.stats-bad {
+    background: var(--grad-bad);  /* red */
+    color: #ffffff;
+}
+.stats-charts {
+    flex: 0 0 auto;
+    display: flex;
+    flex-direction: column;  /* stack charts vertically */
+    gap: 6px;
+    align-items: center;
+    justify-content: center;
+    margin-top: 16px;        /* extra space between tiles and charts */
+}
+.stats-chart {
+    flex: 0 0 auto;
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+}
+.stats-chart .stats-label {
+    font-weight: 700;
+    font-size: 10px;
+    margin-bottom: 4px;   /* space before chart canvas */
+}
+.stats-chart canvas {
+    margin-top: 2px;      /* extra breathing room under label */
+}
+.status-pill {
+    display: inline-block;
+    padding: 2px 8px;
+    border-radius: 9999px;
+    font-weight: 600;
+    font-size: 11px;
+    letter-spacing: 0.02em;
+    box-shadow: 0 2px 6px rgba(15, 23, 42, 0.16);
+}
+.status-ok {
+    background: var(--grad-ok);  /* green */
+    color: #ffffff;
+}
+.status-bad {
+    background: var(--grad-bad);  /* red */
+    color: #ffffff;
+}
+.status-warn {
+    background: var(--grad-warn-soft);  /* yellow */
+    color: #1f2933;
+}
+.calendar-pill {
+    display: inline-block;
+    padding: 2px 6px;
+    border-radius: 9999px;
+    font-size: 11px;
+    font-weight: 600;
+}
+.calendar-sent {
+    background: var(--grad-ok);  /* green */
+    color: #ffffff;
+}
+.calendar-not-sent {
+    background: var(--grad-bad);  /* red */
+    color: #ffffff;
+}
+
+/* Responsive tweaks for smaller viewports */
+@media (max-width: 900px) {
+    html, body {
+        height: auto;
+    }
+    body {
+        overflow-y: auto;
+    }
+    .page {
+        height: auto;
+    }
+    .card {
+        flex-direction: column;
+    }
+    .table-wrapper {
+        flex: none;
+        max-height: 55vh;
+    }
+    .stats-card {
+        max-width: none;
+        margin-top: 8px;
+    }
+    .stats-item {
+        flex: 0 0 calc(50% - 4px); /* two columns on narrow screens */
+    }
+}
+"""
+STYLESHEET_URL = f"/assets/auto_table.{hashlib.sha1(STYLESHEET.encode()).hexdigest()[:12]}.css"
+# Long-lived caching for the content-hashed asset URLs
+ASSET_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+# Report modal rules, only needed once the modal opens; loaded without blocking render
+REPORT_STYLESHEET = """
+.report-modal {
+    background: #ffffff;
+    border-radius: 12px;
+    box-shadow: 0 20px 50px rgba(15, 23, 42, 0.45);
+    padding: 10px 12px;
+    max-width: 520px;
+    width: 100%;
+    font-size: 11px;
+}
+.report-modal-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    margin-bottom: 6px;
+}
+.report-modal-title {
+    font-weight: 700;
+    color: #0f172a;
+}
+.report-modal-close {
+    border: none;
+    background: transparent;
+    font-size: 14px;
+    cursor: pointer;
+    color: #6b7280;
+}
+.report-modal-body {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 4px 12px;
+    margin-bottom: 8px;
+}
+.report-modal-footer {
+    display: flex;
+    justify-content: flex-end;
+    gap: 6px;
+}
+.report-modal label {
+    font-size: 10px;
+    color: #4b5563;
+}
+.report-modal button.primary {
+    border: none;
+    border-radius: 9999px;
+    padding: 4px 10px;
+    font-size: 11px;
+    font-weight: 600;
+    background: var(--grad-ok);
+    color: #ffffff;
+    cursor: pointer;
+    box-shadow: 0 2px 6px rgba(22, 163, 74, 0.35);
+}
+.report-modal button.secondary {
+    border: none;
+    border-radius: 9999px;
+    padding: 4px 10px;
+    font-size: 11px;
+    font-weight: 500;
+    background: #e5e7eb;
+    color: #111827;
+    cursor: pointer;
+}
+"""
+REPORT_STYLESHEET_URL = (
+    f"/assets/report_modal.{hashlib.sha1(REPORT_STYLESHEET.encode()).hexdigest()[:12]}.css"
+)
+
+# Stats doughnut drawing; static, so it is served from a content-hashed URL
+# like the stylesheets. Chart counts come from the page's chart-data JSON.
+CHARTS_SCRIPT = """
+// Draw a small static doughnut: one ring wedge per value and a legend
+// row underneath. Hovering the canvas shows the counts as its title.
+function drawDoughnut(canvas, values, colors, labels) {
+    const dpr = window.devicePixelRatio || 1;
+    const cssW = canvas.clientWidth || 170;
+    const cssH = canvas.clientHeight || 70;
+    canvas.width = Math.round(cssW * dpr);
+    canvas.height = Math.round(cssH * dpr);
+    const ctx = canvas.getContext('2d');
+    ctx.scale(dpr, dpr);
+
+    const legendH = 12;
+    const total = values.reduce((a, b) => a + b, 0);
+    const cx = cssW / 2;
+    const cy = (cssH - legendH) / 2;
+    const rOuter = Math.max(Math.min(cx, cy) - 2, 0);
+    const rInner = rOuter * 0.55;
+    let a0 = -Math.PI / 2;
+    ctx.strokeStyle = '#ffffff';
+    ctx.lineWidth = 1;
+    values.forEach(function (value, i) {
+        if (!total || !value) return;
+        const a1 = a0 + (value / total) * 2 * Math.PI;
+        ctx.beginPath();
+        ctx.arc(cx, cy, rOuter, a0, a1);
+        ctx.arc(cx, cy, rInner, a1, a0, true);
+        ctx.closePath();
+        ctx.fillStyle = colors[i];
+        ctx.fill();
+        ctx.stroke();
+        a0 = a1;
+    });
+
+    ctx.font = '8px sans-serif';
+    ctx.textBaseline = 'middle';
+    const widths = labels.map(function (label) { return 11 + ctx.measureText(label).width; });
+    let x = (cssW - widths.reduce((a, b) => a + b, 0) - 6 * (labels.length - 1)) / 2;
+    const y = cssH - legendH / 2;
+    labels.forEach(function (label, i) {
+        ctx.fillStyle = colors[i];
+        ctx.fillRect(x, y - 4, 8, 8);
+        ctx.fillStyle = '#666666';
+        ctx.fillText(label, x + 11, y);
+        x += widths[i] + 6;
+    });
+
+    let title = '';
+    for (let i = 0; i < labels.length; i++) {
+        title += (i ? '\\n' : '') + sliceLabel(labels[i], values[i], total);
+    }
+    canvas.title = title;
+}
+
+// Hover text for one doughnut segment, e.g. "Activated: 64 (21.3%)"
+function sliceLabel(label, value, total) {
+    const pct = ((value / (total || 1)) * 100).toFixed(1);
+    return `${label}: ${value} (${pct}%)`;
+}
+
+// Colours and labels per chart canvas; the counts come from the card's
+// chart-data JSON so a swapped-in card can be redrawn
+const STATS_CHARTS = {
+    // Starlink doughnut (Activated vs Not Activated)
+    starChart: {
+        colors: [
+            'rgba(34, 197, 94, 0.90)',   // green
+            'rgba(239, 68, 68, 0.90)',   // red
+        ],
+        labels: ['Activated', 'Not Activated'],
+    },
+    // Approval doughnut (Accepted / Pending / Decline)
+    approvalChart: {
+        colors: [
+            'rgba(34, 197, 94, 0.90)',   // green
+            'rgba(250, 204, 21, 0.95)',  // yellow
+            'rgba(239, 68, 68, 0.90)',   // red
+        ],
+        labels: ['Accepted', 'Pending/Blank', 'Decline/Other'],
+    },
+};
+
+function drawStatsCharts() {
+    const dataEl = document.getElementById('chart-data');
+    if (!dataEl) return;
+    const data = JSON.parse(dataEl.textContent);
+    Object.keys(STATS_CHARTS).forEach(function (id) {
+        const el = document.getElementById(id);
+        if (!el) return;
+        const chart = STATS_CHARTS[id];
+        drawDoughnut(el, data[id], chart.colors, chart.labels);
+    });
+}
+
+drawStatsCharts();
+"""
+CHARTS_SCRIPT_URL = f"/assets/charts.{hashlib.sha1(CHARTS_SCRIPT.encode()).hexdigest()[:12]}.js"
+
+
 TEMPLATE = """
 <!DOCTYPE html>
 <html>
@@ -651,615 +1585,14 @@ TEMPLATE = """
     <meta charset="utf-8">
     <title>LEOxSOLAR Schedule Monitoring</title>
     <meta http-equiv="refresh" content="300">
-    <style>
-        html, body {
-            height: 100%;
-            margin: 0;
-        }
-        body {
-            font-family: system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
-            font-size: 12px;
-            background: radial-gradient(circle at top left, #d4e0ff 0, #dde4f0 40%, #d4d4dd 100%);
-            color: #020617;
-            overflow: hidden; /* prevent whole-page scrolling */
-        }
-        .page {
-            max-width: 1400px;
-            height: 100%;
-            margin: 0 auto;
-            padding: 10px;
-            box-sizing: border-box;
-            display: flex;
-            flex-direction: column;
-        }
-        h1 {
-            margin: 4px 0 6px 0;
-            font-size: 20px;
-            letter-spacing: 0.08em;
-            text-transform: uppercase;
-            background: linear-gradient(90deg, #0f172a, #0284c7, #0f172a);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-        .meta-line {
-            font-size: 11px;
-            color: #6b7280;
-            margin-bottom: 6px;
-        }
-        .filter-toggle-bar {
-            display: flex;
-            justify-content: flex-start;
-            margin-bottom: 4px;
-        }
-        .filter-toggle-btn {
-            border: none;
-            border-radius: 9999px;
-            padding: 4px 10px;
-            font-size: 12px;
-            font-weight: 600;
-            background: linear-gradient(135deg, #0ea5e9, #0369a1);
-            color: #ffffff;
-            cursor: pointer;
-            box-shadow: 0 2px 6px rgba(3, 105, 161, 0.35);
-        }
-        .filter-toggle-btn:hover {
-            background: linear-gradient(135deg, #0369a1, #075985);
-        }
-        .filter-container {
-            margin-bottom: 6px;
-        }
-        .filter-bar {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-size: 12px;
-            padding: 4px 10px;
-            border-radius: 9999px;
-            background: rgba(255, 255, 255, 0.85);
-            box-shadow: 0 6px 18px rgba(15, 23, 42, 0.10);
-        }
-        .filter-bar label {
-            color: #4b5563;
-            font-weight: 500;
-        }
-        .filter-bar select {
-            font-size: 12px;
-            padding: 3px 10px;
-            border-radius: 9999px;
-            border: 1px solid rgba(148, 163, 184, 0.7);
-            background-color: #ffffff;
-            color: #111827;
-            box-shadow: 0 2px 6px rgba(15, 23, 42, 0.06);
-            appearance: none;
-        }
-        .filter-bar select:focus {
-            outline: none;
-            border-color: #38bdf8;
-            box-shadow:
-                0 0 0 1px rgba(56, 189, 248, 0.7),
-                0 4px 10px rgba(56, 189, 248, 0.25);
-        }
-        .filter-bar select:hover {
-            border-color: #0ea5e9;
-        }
-        .filter-clear-link {
-            margin-left: 8px;
-            font-size: 11px;
-            font-weight: 500;
-            color: #0ea5e9;
-            text-decoration: none;
-            white-space: nowrap;
-        }
-        .filter-clear-link:hover {
-            text-decoration: underline;
-        }
-        .report-bar {
-            margin: 4px 0 8px 0;
-            font-size: 11px;
-            display: flex;
-            justify-content: flex-start;
-        }
-        .report-trigger-btn {
-            border: none;
-            border-radius: 9999px;
-            padding: 4px 10px;
-            font-size: 11px;
-            font-weight: 600;
-            background: linear-gradient(135deg, #22c55e, #16a34a);
-            color: #ffffff;
-            cursor: pointer;
-            box-shadow: 0 2px 6px rgba(22, 163, 74, 0.35);
-        }
-        .report-trigger-btn:hover {
-            background: linear-gradient(135deg, #16a34a, #15803d);
-        }
-        .report-modal-backdrop {
-            position: fixed;
-            inset: 0;
-            background: rgba(15, 23, 42, 0.45);
-            display: none;
-            align-items: center;
-            justify-content: center;
-            z-index: 50;
-        }
-        .report-modal {
-            background: #ffffff;
-            border-radius: 12px;
-            box-shadow: 0 20px 50px rgba(15, 23, 42, 0.45);
-            padding: 10px 12px;
-            max-width: 520px;
-            width: 100%;
-            font-size: 11px;
-        }
-        .report-modal-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 6px;
-        }
-        .report-modal-title {
-            font-weight: 700;
-            color: #0f172a;
-        }
-        .report-modal-close {
-            border: none;
-            background: transparent;
-            font-size: 14px;
-            cursor: pointer;
-            color: #6b7280;
-        }
-        .report-modal-body {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 4px 12px;
-            margin-bottom: 8px;
-        }
-        .report-modal-footer {
-            display: flex;
-            justify-content: flex-end;
-            gap: 6px;
-        }
-        .report-modal label {
-            font-size: 10px;
-            color: #4b5563;
-        }
-        .report-modal button.primary {
-            border: none;
-            border-radius: 9999px;
-            padding: 4px 10px;
-            font-size: 11px;
-            font-weight: 600;
-            background: linear-gradient(135deg, #22c55e, #16a34a);
-            color: #ffffff;
-            cursor: pointer;
-            box-shadow: 0 2px 6px rgba(22, 163, 74, 0.35);
-        }
-        .report-modal button.secondary {
-            border: none;
-            border-radius: 9999px;
-            padding: 4px 10px;
-            font-size: 11px;
-            font-weight: 500;
-            background: #e5e7eb;
-            color: #111827;
-            cursor: pointer;
-        }
-        .card {
-            background: linear-gradient(135deg, #f9fafb 0%, #e2e8f0 40%, #cbd5f5 100%);
-            border-radius: 10px;
-            box-shadow: 0 18px 44px rgba(15, 23, 42, 0.30);
-            border: 1px solid rgba(71, 85, 105, 0.55);
-            padding: 8px;
-            box-sizing: border-box;
-            flex: 1;                 /* take remaining space below header/meta */
-            display: flex;
-            flex-direction: row;
-            gap: 8px;
-            overflow: hidden;
-        }
-        .table-wrapper {
-            flex: 3;
-            overflow-y: auto;        /* scroll only table area */
-        }
-        table {
-            border-collapse: collapse;
-            width: 100%;
-            table-layout: fixed;
-        }
-        th, td {
-            border: 1px solid #cbd5e1;
-            padding: 2px 4px;
-            text-align: center;
-            font-size: 11px;
-        }
-        th {
-            background-color: #cbd5f5;
-            font-weight: 600;
-            color: #020617;
-            white-space: normal;           /* allow header text to wrap */
-            word-wrap: break-word;         /* break long tokens like 'Delivery/Installation' */
-            word-break: break-word;
-        }
-        thead th {
-            position: sticky;
-            top: 0;
-            z-index: 2;
-        }
-        tbody tr:nth-child(even) td {
-            background-color: #f9fafb;
-        }
-        tbody tr:nth-child(odd) td {
-            background-color: #ffffff;
-        }
-        tbody tr:hover td {
-            background-color: #e5f0ff;
-        }
-        .row-warning td {
-            background-color: #fef9c3;  /* soft yellow */
-            color: #1f2933;
-        }
-        .row-critical td {
-            background-color: #fee2e2;  /* soft red */
-            color: #b91c1c;
-        }
-        .region-cell {
-            text-align: center;
-            font-weight: 600;
-        }
-        .school-cell {
-            text-align: center;
-            white-space: normal;
-            word-wrap: break-word;
-        }
-        .status-cell {
-            text-align: left;
-            padding-left: 6px;
-            white-space: normal;
-            word-wrap: break-word;
-        }
-        .stats-card {
-            flex: 1;
-            max-width: 360px;
-            padding: 6px;
-            background: linear-gradient(135deg, #cbd5f5 0%, #e2e8f0 40%, #f9fafb 100%);
-            border-radius: 10px;
-            box-shadow:
-                0 0 0 1px rgba(71, 85, 105, 0.65),
-                0 20px 50px rgba(15, 23, 42, 0.32);
-            font-size: 12px;
-            overflow-y: auto;
-            overflow-x: hidden;
-            display: flex;
-            flex-direction: column;
-        }
-        .stats-title {
-            font-weight: 700;
-            margin-bottom: 6px;
-            color: #0f172a;
-            letter-spacing: 0.05em;
-            text-transform: uppercase;
-            text-align: center;
-        }
-        .stats-main {
-            flex: 1;
-            display: flex;
-            flex-direction: column;
-            gap: 4px;
-            overflow: hidden;
-        }
-        .stats-note {
-            font-size: 11px;
-            font-weight: 600;
-            color: #020617;
-            text-align: center;
-            margin-bottom: 8px;
-        }
-        .stats-filter-note {
-            font-size: 10px;
-            color: #4b5563;
-            text-align: center;
-            margin-bottom: 6px;
-        }
-        .stats-filter-clear {
-            margin-left: 6px;
-            font-size: 10px;
-            color: #0ea5e9;
-            text-decoration: none;
-        }
-        .stats-filter-clear:hover {
-            text-decoration: underline;
-        }
-        .stats-calendar-summary {
-            font-size: 10px;
-            color: #374151;
-            margin-bottom: 4px;
-        }
-        .stats-grid {
-            flex: 0 0 auto;
-            display: grid;
-            grid-template-columns: repeat(2, minmax(120px, 1fr)); /* two balanced columns */
-            column-gap: 24px;          /* extra clear space between columns */
-            row-gap: 8px;              /* comfortable vertical spacing */
-            max-width: 340px;          /* slightly wider to keep tiles readable */
-            margin: 0 auto;            /* center grid inside stats card */
-        }
-        .stats-item {
-            width: 100%;              /* take full cell width */
-            border-radius: 6px;
-            background: #e0e7ff;
-            border: 1px solid rgba(79, 70, 229, 0.8);
-            box-shadow: 0 2px 8px rgba(15, 23, 42, 0.16);
-            padding: 4px 8px;         /* a bit more breathing room */
-            text-align: center;
-        }
-        .stats-tile-link {
-            display: block;
-            width: 100%;
-            height: 100%;
-            padding: 0;
-            margin: 0;
-            border: none;
-            background: transparent;
-            text-decoration: none;
-            color: inherit;
-            cursor: pointer;
-        }
-        .stats-label {
-            color: #4b5563;
-            font-size: 9px;
-            line-height: 1.15;
-            text-align: center;
-        }
-        .stats-value {
-            font-weight: 700;
-            font-size: 11px;
-            line-height: 1.15;
-            color: #0f172a;
-            text-align: center;
-        }
-        /* Ensure text is white on error tiles like Starlink Not Activated / Calendar Invite Not Sent */
-        /* Color tiles by type (using fixed order) */
-        .stats-grid .stats-item:nth-child(1),
-        .stats-grid .stats-item:nth-child(3),
-        .stats-grid .stats-item:nth-child(6) {
-            /* ✔ tiles: Starlink Activated, Approval Accepted, Calendar Sent */
-            background: linear-gradient(135deg, #22c55e, #16a34a);
-        }
-        .stats-grid .stats-item:nth-child(1) .stats-label,
-        .stats-grid .stats-item:nth-child(1) .stats-value,
-        .stats-grid .stats-item:nth-child(3) .stats-label,
-        .stats-grid .stats-item:nth-child(3) .stats-value,
-        .stats-grid .stats-item:nth-child(6) .stats-label,
-        .stats-grid .stats-item:nth-child(6) .stats-value {
-            color: #ffffff;
-        }
-        .stats-grid .stats-item:nth-child(2),
-        .stats-grid .stats-item:nth-child(4) {
-            /* ⚠ tiles: Starlink Not Activated, Approval Pending/Blank */
-            background: linear-gradient(135deg, #fde68a, #facc15);
-        }
-        .stats-grid .stats-item:nth-child(2) .stats-label,
-        .stats-grid .stats-item:nth-child(2) .stats-value,
-        .stats-grid .stats-item:nth-child(4) .stats-label,
-        .stats-grid .stats-item:nth-child(4) .stats-value {
-            color: #1f2933;
-        }
-        .stats-grid .stats-item:nth-child(5),
-        .stats-grid .stats-item:nth-child(7) {
-            /* ✖ tiles: Approval Decline, Calendar Invite Not Sent */
-            background: linear-gradient(135deg, #f97373, #dc2626);
-        }
-        .stats-grid .stats-item:nth-child(5) .stats-label,
-        .stats-grid .stats-item:nth-child(5) .stats-value,
-        .stats-grid .stats-item:nth-child(7) .stats-label,
-        .stats-grid .stats-item:nth-child(7) .stats-value {
-            color: #ffffff;
-        }
-        /* Ensure text is white on all error tiles (stats-bad), overriding nth-child text colors */
-        .stats-grid .stats-item.stats-bad .stats-label,
-        .stats-grid .stats-item.stats-bad .stats-value {
-            color: #ffffff !important;
-        }
-        /* Ensure text is white on warning tiles (stats-warn), e.g. Approval Pending / Blank */
-        .stats-grid .stats-item.stats-warn .stats-label,
-        .stats-grid .stats-item.stats-warn .stats-value {
-            color: #ffffff !important;
-        }
-        .stats-grid .stats-item.stats-ok {
-            background: linear-gradient(135deg, #22c55e, #16a34a);  /* green */
-            color: #ffffff;
-        }
-        .stats-grid .stats-item.stats-warn {
-            background: linear-gradient(135deg, #facc15, #eab308);  /* darker yellow */
-            color: #1f2933;
-        }
-        .stats-grid .stats-item.stats-bad {
-            background: linear-gradient(135deg, #f97373, #dc2626);  /* red */
-            color: #ffffff;
-        }
-        .stats-grid .stats-item.stats-full {
-            grid-column: 1 / -1; /* span full row */
-        }
-        .stats-charts {
-            flex: 0 0 auto;
-            display: flex;
-            flex-direction: column;  /* stack charts vertically */
-            gap: 6px;
-            align-items: center;
-            justify-content: center;
-            margin-top: 16px;        /* extra space between tiles and charts */
-        }
-        .stats-chart {
-            flex: 0 0 auto;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-        }
-        .stats-chart .stats-label {
-            font-weight: 700;
-            font-size: 10px;
-            margin-bottom: 4px;   /* space before chart canvas */
-        }
-        .stats-chart canvas {
-            margin-top: 2px;      /* extra breathing room under label */
-        }
-        .status-pill {
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 9999px;
-            font-weight: 600;
-            font-size: 11px;
-            letter-spacing: 0.02em;
-            box-shadow: 0 2px 6px rgba(15, 23, 42, 0.16);
-        }
-        .status-ok {
-            background: linear-gradient(135deg, #22c55e, #16a34a);  /* green */
-            color: #ffffff;
-        }
-        .status-bad {
-            background: linear-gradient(135deg, #f97373, #dc2626);  /* red */
-            color: #ffffff;
-        }
-        .status-warn {
-            background: linear-gradient(135deg, #fde68a, #facc15);  /* yellow */
-            color: #1f2933;
-        }
-        .calendar-pill {
-            display: inline-block;
-            padding: 2px 6px;
-            border-radius: 9999px;
-            font-size: 11px;
-            font-weight: 600;
-        }
-        .calendar-sent {
-            background: linear-gradient(135deg, #22c55e, #16a34a);  /* green */
-            color: #ffffff;
-        }
-        .calendar-not-sent {
-            background: linear-gradient(135deg, #f97373, #dc2626);  /* red */
-            color: #ffffff;
-        }
-        .report-bar {
-            margin: 4px 0 8px 0;
-            font-size: 11px;
-            display: flex;
-            justify-content: flex-start;
-        }
-        .report-trigger-btn {
-            border: none;
-            border-radius: 9999px;
-            padding: 4px 10px;
-            font-size: 11px;
-            font-weight: 600;
-            background: linear-gradient(135deg, #22c55e, #16a34a);
-            color: #ffffff;
-            cursor: pointer;
-            box-shadow: 0 2px 6px rgba(22, 163, 74, 0.35);
-        }
-        .report-trigger-btn:hover {
-            background: linear-gradient(135deg, #16a34a, #15803d);
-        }
-        .report-modal-backdrop {
-            position: fixed;
-            inset: 0;
-            background: rgba(15, 23, 42, 0.45);
-            display: none;
-            align-items: center;
-            justify-content: center;
-            z-index: 50;
-        }
-        .report-modal {
-            background: #ffffff;
-            border-radius: 12px;
-            box-shadow: 0 20px 50px rgba(15, 23, 42, 0.45);
-            padding: 10px 12px;
-            max-width: 520px;
-            width: 100%;
-            font-size: 11px;
-        }
-        .report-modal-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 6px;
-        }
-        .report-modal-title {
-            font-weight: 700;
-            color: #0f172a;
-        }
-        .report-modal-close {
-            border: none;
-            background: transparent;
-            font-size: 14px;
-            cursor: pointer;
-            color: #6b7280;
-        }
-        .report-modal-body {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 4px 12px;
-            margin-bottom: 8px;
-        }
-        .report-modal-footer {
-            display: flex;
-            justify-content: flex-end;
-            gap: 6px;
-        }
-        .report-modal label {
-            font-size: 10px;
-            color: #4b5563;
-        }
-        .report-modal button.primary {
-            border: none;
-            border-radius: 9999px;
-            padding: 4px 10px;
-            font-size: 11px;
-            font-weight: 600;
-            background: linear-gradient(135deg, #22c55e, #16a34a);
-            color: #ffffff;
-            cursor: pointer;
-            box-shadow: 0 2px 6px rgba(22, 163, 74, 0.35);
-        }
-        .report-modal button.secondary {
-            border: none;
-            border-radius: 9999px;
-            padding: 4px 10px;
-            font-size: 11px;
-            font-weight: 500;
-            background: #e5e7eb;
-            color: #111827;
-            cursor: pointer;
-        }
-
-        /* Responsive tweaks for smaller viewports */
-        @media (max-width: 900px) {
-            html, body {
-                height: auto;
-            }
-            body {
-                overflow-y: auto;
-            }
-            .page {
-                height: auto;
-            }
-            .card {
-                flex-direction: column;
-            }
-            .table-wrapper {
-                flex: none;
-                max-height: 55vh;
-            }
-            .stats-card {
-                max-width: none;
-                margin-top: 8px;
-            }
-            .stats-item {
-                flex: 0 0 calc(50% - 4px); /* two columns on narrow screens */
-            }
-        }
-    </style>
+    <link rel="stylesheet" href="{{ stylesheet_url }}">
+    {% if show_report %}
+    <link rel="preload" as="style" href="{{ report_stylesheet_url }}" onload="this.onload=null;this.rel='stylesheet'">
+    <noscript><link rel="stylesheet" href="{{ report_stylesheet_url }}"></noscript>
+    {% endif %}
+    {% if stats.active %}
+    <script src="{{ charts_script_url }}" defer></script>
+    {% endif %}
 </head>
 <body>
     {% if show_report %}
@@ -1271,13 +1604,7 @@ TEMPLATE = """
             </div>
             <form method="get" action="" class="report-modal-form">
                 <input type="hidden" name="region" value="{{ selected_region }}">
-                {% if selected_schedule_list %}
-                {% for s in selected_schedule_list %}
-                <input type="hidden" name="schedule" value="{{ s }}">
-                {% endfor %}
-                {% else %}
-                <input type="hidden" name="schedule" value="">
-                {% endif %}
+                {{ schedule_hidden }}
                 <input type="hidden" name="installation" value="{{ selected_installation }}">
                 <input type="hidden" name="tile" value="{{ selected_tile }}">
                 <input type="hidden" name="lot" value="{{ selected_lot }}">
@@ -1316,7 +1643,7 @@ TEMPLATE = """
             Auto-refresh: 5 minutes | Last update: {{ last_updated }}
         </div>
         <div class="meta-line">
-            Showing {{ rows|length }} records
+            Showing <span id="row-count">{{ row_count }}</span> records
             • Region: {{ selected_region or 'All' }}
             • Schedule: {{ selected_schedule or 'All' }}
         </div>
@@ -1326,80 +1653,7 @@ TEMPLATE = """
                   Filters
               </button>
           </div>
-          <div class="filter-container" id="filters-container" style="display: none;">
-              <form method="get" class="filter-bar">
-                    {% if include_unscheduled %}
-                    <input type="hidden" name="full" value="1">
-                    {% endif %}
-                    {% if show_report %}
-                    <input type="hidden" name="report" value="1">
-                    {% endif %}
-                    {% if selected_tile %}
-                    <input type="hidden" id="tile-input" name="tile" value="{{ selected_tile }}">
-                    {% else %}
-                    <input type="hidden" id="tile-input" name="tile" value="">
-                    {% endif %}
-                    <label for="lot-select">Lot #:</label>
-                    <select id="lot-select" name="lot">
-                      <option value="">All Lots</option>
-                      <option value="Lot #1" {% if selected_lot == 'Lot #1' %}selected{% endif %}>Lot #1</option>
-                      <option value="Lot #2" {% if selected_lot == 'Lot #2' %}selected{% endif %}>Lot #2</option>
-                      <option value="Lot #3" {% if selected_lot == 'Lot #3' %}selected{% endif %}>Lot #3</option>
-                  </select>
-                    <label for="region-select">Region:</label>
-                    <select id="region-select" name="region">
-                    <option value="">All Regions</option>
-                    {% for r in region_options %}
-                    <option value="{{ r }}" {% if selected_region == r %}selected{% endif %}>{{ r }}</option>
-                    {% endfor %}
-                </select>
-                  <label for="schedule-select">Schedule:</label>
-                  <select id="schedule-select" name="schedule" multiple size="1">
-                    {% for d in schedule_options %}
-                    <option value="{{ d }}" {% if selected_schedule_list and d in selected_schedule_list %}selected{% endif %}>{{ d }}</option>
-                    {% endfor %}
-                </select>
-                  <label for="installation-select">Installation:</label>
-                    <select id="installation-select" name="installation">
-                      <option value="">All Installation Statuses</option>
-                      <option value="__blank__" {% if selected_installation == '__blank__' %}selected{% endif %}>No Installation Status</option>
-                      {% for inst in installation_options %}
-                      <option value="{{ inst }}" {% if selected_installation == inst %}selected{% endif %}>{{ inst }}</option>
-                      {% endfor %}
-                  </select>
-                  <label for="final-status-select">Final:</label>
-                  <select id="final-status-select" name="final">
-                      <option value="">All</option>
-                      {% for fs in final_status_options %}
-                      <option value="{{ fs }}" {% if selected_final == fs %}selected{% endif %}>{{ fs }}</option>
-                      {% endfor %}
-                  </select>
-                  <label for="validated-select">Validated:</label>
-                  <select id="validated-select" name="validated">
-                      <option value="">All</option>
-                      {% for v in validated_options %}
-                      <option value="{{ v }}" {% if selected_validated == v %}selected{% endif %}>{{ v }}</option>
-                      {% endfor %}
-                  </select>
-                  <input
-                      id="search-input"
-                      type="text"
-                      name="search"
-                      value="{{ selected_search or '' }}"
-                      placeholder="Search..."
-                      style="font-size: 12px; padding: 3px 8px; border-radius: 9999px; border: 1px solid rgba(148,163,184,0.7); min-width: 140px; margin-left: 4px;"
-                  />
-                  <button type="submit" class="filter-toggle-btn" style="margin-left: 4px; padding: 3px 10px; font-size: 11px;">
-                      Apply
-                  </button>
-                  <a
-                      href="?{% if show_report %}report=1&{% endif %}{% if include_unscheduled %}full=1{% endif %}"
-                      class="filter-clear-link"
-                  >
-                      Clear filters
-                  </a>
-              </form>
-          </div>
+          {% include "filters.html" %}
           {% if show_report %}
           <div class="report-bar">
               <button type="button" class="report-trigger-btn" id="open-report-modal">
@@ -1408,7 +1662,230 @@ TEMPLATE = """
           </div>
           {% endif %}
 
-        <div class="card">
+        {% include "card.html" %}
+    </div>
+  <script>
+  // Fetch the table and stats card for these query params and swap it in.
+  // The card is fetched first; the DOM writes (plus onSwap's) are then
+  // batched into one frame.
+  function swapCard(params, onSwap) {
+      params.delete('offset');
+      params.set('partial', 'card');
+      return fetch('?' + params.toString())
+          .then(function (resp) {
+              if (!resp.ok) throw new Error(resp.statusText);
+              return resp.text();
+          })
+          .then(function (html) {
+              requestAnimationFrame(function () {
+                  document.querySelector('.card').outerHTML = html;
+                  if (onSwap) onSwap();
+                  initCard();
+              });
+          });
+  }
+
+  // Swap in the card for a new tile filter instead of reloading the page.
+  // Falls back to resubmitting the filter form.
+  function submitTileFilter(tileValue) {
+      const form = document.querySelector('.filter-bar');
+      const card = document.querySelector('.card');
+      const tileInputs = document.querySelectorAll('input[name="tile"]');
+      if (!form || !card) return;
+      const params = new URLSearchParams(window.location.search);
+      params.delete('offset');
+      if (tileValue) {
+          params.set('tile', tileValue);
+      } else {
+          params.delete('tile');
+      }
+      const query = params.toString();
+      swapCard(params, function () {
+          tileInputs.forEach(function (input) { input.value = tileValue; });
+          history.pushState(null, '', '?' + query);
+      }).catch(function () {
+          tileInputs.forEach(function (input) { input.value = tileValue; });
+          form.submit();
+      });
+  }
+
+  // Wire up a freshly rendered card: row count, charts and row loading
+  function initCard() {
+      const card = document.querySelector('.card');
+      document.getElementById('row-count').textContent = card.dataset.rowCount;
+      if (window.drawStatsCharts) drawStatsCharts();
+      observeRows();
+  }
+
+  // Back/forward across swapped-in tile filters reloads that URL's page
+  window.addEventListener('popstate', function () {
+      window.location.reload();
+  });
+
+  // One delegated listener for the stats tiles and "Clear filter"; it
+  // survives the card being swapped out
+  document.addEventListener('click', function (e) {
+      const target = e.target.closest('[data-tile]');
+      if (!target) return;
+      e.preventDefault();
+      submitTileFilter(target.dataset.tile);
+  });
+
+
+  (function () {
+      const toggleBtn = document.getElementById('toggle-filters');
+      const container = document.getElementById('filters-container');
+      if (!toggleBtn || !container) return;
+
+      let visible = false;
+      function update() {
+          container.style.display = visible ? 'block' : 'none';
+      }
+      toggleBtn.addEventListener('click', function () {
+          visible = !visible;
+          update();
+      });
+      // Keep filters hidden by default on load
+      update();
+  })();
+
+  (function () {
+      const backdrop = document.getElementById('report-modal-backdrop');
+      const openBtn = document.getElementById('open-report-modal');
+      const closeBtn = document.getElementById('close-report-modal');
+      const cancelBtn = document.getElementById('cancel-report-modal');
+
+      if (!backdrop || !openBtn || !closeBtn || !cancelBtn) return;
+
+      function openModal() {
+          backdrop.style.display = 'flex';
+      }
+      function closeModal() {
+          backdrop.style.display = 'none';
+      }
+
+      openBtn.addEventListener('click', openModal);
+      closeBtn.addEventListener('click', closeModal);
+      cancelBtn.addEventListener('click', closeModal);
+      backdrop.addEventListener('click', function (e) {
+          if (e.target === backdrop) {
+              closeModal();
+          }
+      });
+  })();
+
+  // Fetch further table rows as the placeholder row scrolls into view
+  let rowObserver = null;
+  function observeRows() {
+      if (rowObserver) rowObserver.disconnect();
+      const sentinel = document.getElementById('rows-sentinel');
+      if (!sentinel || !('IntersectionObserver' in window)) return;
+      const card = document.querySelector('.card');
+      const total = Number(card.dataset.rowCount);
+      const pageSize = {{ page_size }};
+      const rowHeight = {{ row_height }};
+      let loading = false;
+
+      const rowTmpl = document.getElementById('row-tmpl').content.firstElementChild;
+
+      // Each NDJSON line is one row: plain cells are strings, pill cells
+      // are [class, label] pairs and the last item is the row's class.
+      function buildRow(cells) {
+          const tr = rowTmpl.cloneNode(true);
+          tr.className = cells[cells.length - 1];
+          for (let i = 0; i < tr.cells.length; i++) {
+              const value = cells[i];
+              if (Array.isArray(value)) {
+                  const pill = tr.cells[i].firstChild;
+                  pill.className += ' ' + value[0];
+                  pill.textContent = value[1];
+              } else {
+                  tr.cells[i].textContent = value;
+              }
+          }
+          return tr;
+      }
+
+      // Insert rows as each network chunk arrives instead of after the whole
+      // body; every inserted row is recorded in added
+      function appendRows(reader, added) {
+          const decoder = new TextDecoder();
+          let pending = '';
+          return reader.read().then(function step(result) {
+              pending += decoder.decode(result.value || new Uint8Array(), { stream: !result.done });
+              const lines = pending.split('\\n');
+              pending = result.done ? '' : lines.pop();
+              const batch = document.createDocumentFragment();
+              for (const line of lines) {
+                  if (line) added.push(batch.appendChild(buildRow(JSON.parse(line))));
+              }
+              sentinel.before(batch);
+              return result.done ? null : reader.read().then(step);
+          });
+      }
+
+      const observer = new IntersectionObserver(function (entries) {
+          if (!entries[0].isIntersecting || loading) return;
+          loading = true;
+          const params = new URLSearchParams(window.location.search);
+          params.set('offset', sentinel.dataset.next);
+          params.set('partial', 'ndjson');
+          params.set('v', card.dataset.version);
+          const added = [];
+          fetch('?' + params.toString())
+              .then(function (resp) {
+                  // 409: the sheets changed since this card was rendered, so
+                  // its rows can't be continued from the new data; reload
+                  // the whole card instead
+                  if (resp.status === 409) {
+                      observer.disconnect();
+                      swapCard(new URLSearchParams(window.location.search)).catch(function () {
+                          window.location.reload();
+                      });
+                      return;
+                  }
+                  if (!resp.ok) throw new Error(resp.statusText);
+                  return appendRows(resp.body.getReader(), added).then(function () {
+                      const next = Number(sentinel.dataset.next) + pageSize;
+                      if (next >= total) {
+                          observer.disconnect();
+                          sentinel.remove();
+                          return;
+                      }
+                      sentinel.dataset.next = next;
+                      sentinel.style.height = ((total - next) * rowHeight) + 'px';
+                      loading = false;
+                      // Re-observe so a sentinel that is still visible fires again
+                      observer.unobserve(sentinel);
+                      observer.observe(sentinel);
+                  });
+              })
+              .catch(function () {
+                  // Drop this window's partial rows and retry it on the next
+                  // intersection, after a pause so a failing server is not
+                  // hit in a tight loop
+                  added.forEach(function (tr) { tr.remove(); });
+                  setTimeout(function () {
+                      loading = false;
+                      observer.unobserve(sentinel);
+                      observer.observe(sentinel);
+                  }, 2000);
+              });
+      }, { root: sentinel.closest('.table-wrapper'), rootMargin: '400px 0px' });
+      observer.observe(sentinel);
+      rowObserver = observer;
+  }
+
+  observeRows();
+  </script>
+</body>
+</html>
+"""
+
+# Table and stats card; also rendered on its own (?partial=card) when a
+# stats tile swaps in a new tile filter
+CARD_TEMPLATE = """
+        <div class="card" data-row-count="{{ row_count }}" data-version="{{ version }}">
             <div class="table-wrapper">
                 <table>
                     <thead>
@@ -1428,68 +1905,23 @@ TEMPLATE = """
                         </tr>
                     </thead>
                     <tbody>
-                        {% for row in rows %}
-                        {% set star = (row["Starlink Status"] or "") | lower %}
-                        {% set appr = (row["Approval"] or "") | lower %}
-                        {% set row_class = '' %}
-                        {% if 'declin' in appr %}
-                            {% set row_class = 'row-critical' %}
-                        {% elif star != 'activated' %}
-                            {% set row_class = 'row-warning' %}
-                        {% endif %}
-                          <tr class="{{ row_class }}">
-                              <td class="region-cell">{{ row["Region"] }}</td>
-                              <td>{{ row["Division"] }}</td>
-                              <td>{{ row["Province"] }}</td>
-                              <td class="school-cell">{{ row["BEIS School ID"] }}</td>
-                            <td>{{ row["Schedule"] }}</td>
-                            <td>
-                                {% set cal = row["Calendar Status"] or "" %}
-                                <span class="calendar-pill
-                                    {% if cal == 'Sent' %}
-                                        calendar-sent
-                                    {% elif cal %}
-                                        calendar-not-sent
-                                    {% endif %}">
-                                    {{ cal or '-' }}
-                                </span>
-                            </td>
-                            <td>
-                                {% if row["Start Time"] and row["End Time"] %}
-                                    {{ row["Start Time"] }} - {{ row["End Time"] }}
-                                {% else %}
-                                    {{ row["Start Time"] or row["End Time"] }}
-                                {% endif %}
-                            </td>
-                            <td>{{ row["Installation Status"] }}</td>
-                            <td>
-                                <span class="status-pill {% if star == 'activated' %}status-ok{% else %}status-bad{% endif %}">
-                                    {{ row["Starlink Status"] or 'Not Activated' }}
-                                </span>
-                            </td>
-                            <td>
-                                <span class="status-pill
-                                    {% if appr == 'accepted' %}
-                                        status-ok
-                                    {% elif appr == 'pending' or appr == '' %}
-                                        status-warn
-                                    {% else %}
-                                        status-bad
-                                    {% endif %}">
-                                    {{ row["Approval"] or 'Pending' }}
-                                </span>
-                            </td>
-                            <td>{{ row["Final Status"] }}</td>
-                            <td>{{ row["Validated?"] }}</td>
+                        {{ rows_html }}
+                        {% if next_offset < row_count %}
+                        <tr id="rows-sentinel" data-next="{{ next_offset }}"
+                            style="height: {{ (row_count - next_offset) * row_height }}px">
+                            <td colspan="12"></td>
                         </tr>
-                        {% endfor %}
-                        {% if rows|length == 0 %}
+                        {% endif %}
+                        {% if row_count == 0 %}
                         <tr>
                             <td colspan="12">No data available (check sheet names/columns or schedule values).</td>
                         </tr>
                         {% endif %}
                     </tbody>
                 </table>
+                {% if next_offset < row_count %}
+                <template id="row-tmpl"><tr><td class="region-cell"></td><td></td><td></td><td class="school-cell"></td><td></td><td><span class="calendar-pill"></span></td><td></td><td></td><td><span class="status-pill"></span></td><td><span class="status-pill"></span></td><td></td><td></td></tr></template>
+                {% endif %}
             </div>
             {% if stats.active %}
             <div class="stats-card">
@@ -1507,7 +1939,7 @@ TEMPLATE = """
                 {% if selected_tile %}
                 <div class="stats-filter-note">
                     Status filter applied.
-                    <a href="#" onclick="clearTileFilter(); return false;" class="stats-filter-clear">
+                    <a href="#" class="stats-filter-clear" data-tile="">
                         Clear filter
                     </a>
                 </div>
@@ -1517,8 +1949,7 @@ TEMPLATE = """
                               {# Row 1: Starlink #}
                               {% if stats.star_activated %}
                               <div class="stats-item stats-ok">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('star_activated')">
+                                  <button type="button" class="stats-tile-link" data-tile="star_activated">
                                       <div class="stats-label">✔ Starlink Activated</div>
                                       <div class="stats-value">{{ stats.star_activated }}</div>
                                   </button>
@@ -1526,8 +1957,7 @@ TEMPLATE = """
                               {% endif %}
                               {% if stats.star_not_activated %}
                               <div class="stats-item stats-bad">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('star_not_activated')">
+                                  <button type="button" class="stats-tile-link" data-tile="star_not_activated">
                                       <div class="stats-label">✖ Starlink Not Activated</div>
                                       <div class="stats-value">{{ stats.star_not_activated }}</div>
                                   </button>
@@ -1537,8 +1967,7 @@ TEMPLATE = """
                               {# Row 2: Approval (Accepted / Pending) #}
                               {% if stats.approval_accepted %}
                               <div class="stats-item stats-ok">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('approval_accepted')">
+                                  <button type="button" class="stats-tile-link" data-tile="approval_accepted">
                                       <div class="stats-label">✔ Approval Accepted</div>
                                       <div class="stats-value">{{ stats.approval_accepted }}</div>
                                   </button>
@@ -1546,8 +1975,7 @@ TEMPLATE = """
                               {% endif %}
                               {% if stats.approval_pending %}
                               <div class="stats-item stats-warn">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('approval_pending')">
+                                  <button type="button" class="stats-tile-link" data-tile="approval_pending">
                                       <div class="stats-label">⚠ Approval Pending / Blank</div>
                                       <div class="stats-value">{{ stats.approval_pending }}</div>
                                   </button>
@@ -1557,8 +1985,7 @@ TEMPLATE = """
                               {# Row 3: Calendar (Sent / Not Sent) #}
                               {% if stats.calendar_sent %}
                               <div class="stats-item stats-ok">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('calendar_sent')">
+                                  <button type="button" class="stats-tile-link" data-tile="calendar_sent">
                                       <div class="stats-label">✔ Calendar Sent</div>
                                       <div class="stats-value">{{ stats.calendar_sent }}</div>
                                   </button>
@@ -1566,8 +1993,7 @@ TEMPLATE = """
                               {% endif %}
                               {% if stats.calendar_not_sent %}
                               <div class="stats-item stats-bad">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('calendar_not_sent')">
+                                  <button type="button" class="stats-tile-link" data-tile="calendar_not_sent">
                                       <div class="stats-label">✖ Calendar Invite Not Sent</div>
                                       <div class="stats-value">{{ stats.calendar_not_sent }}</div>
                                   </button>
@@ -1577,8 +2003,7 @@ TEMPLATE = """
                               {# Row 4: S1 Installed (Success) #}
                               {% if stats.s1_success %}
                               <div class="stats-item stats-ok">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('s1_success')">
+                                  <button type="button" class="stats-tile-link" data-tile="s1_success">
                                       <div class="stats-label">✔ S1 – Installed (Success)</div>
                                       <div class="stats-value">{{ stats.s1_success }}</div>
                                   </button>
@@ -1588,8 +2013,7 @@ TEMPLATE = """
                               {# Row 5: Approval Decline / Other #}
                               {% if stats.approval_decline %}
                               <div class="stats-item stats-bad">
-                                  <button type="button" class="stats-tile-link"
-                                          onclick="applyTileFilter('approval_decline')">
+                                  <button type="button" class="stats-tile-link" data-tile="approval_decline">
                                       <div class="stats-label">✖ Approval Decline / Other</div>
                                       <div class="stats-value">{{ stats.approval_decline }}</div>
                                   </button>
@@ -1609,180 +2033,327 @@ TEMPLATE = """
                                           style="width: 100%; max-width: 170px; height: 70px;"></canvas>
                               </div>
                           </div>
+                          <script id="chart-data" type="application/json">{{ chart_data|tojson }}</script>
                       </div>
                     </div>
                 </div>
             </div>
             {% endif %}
         </div>
-    </div>
-</body>
-</html>
-  <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-  <script>
-  function applyTileFilter(tileValue) {
-      const form = document.querySelector('.filter-bar');
-      if (!form) return;
-      let tileInput = document.getElementById('tile-input');
-      if (!tileInput) {
-          tileInput = document.createElement('input');
-          tileInput.type = 'hidden';
-          tileInput.name = 'tile';
-          tileInput.id = 'tile-input';
-          form.appendChild(tileInput);
-      }
-      tileInput.value = tileValue;
-      form.submit();
-  }
+"""
 
-  function clearTileFilter() {
-      const form = document.querySelector('.filter-bar');
-      if (!form) return;
-      const tileInput = document.getElementById('tile-input');
-      if (tileInput) {
-          tileInput.value = '';
-      }
-      form.submit();
-  }
+# Filter form; a separate template so its mostly static markup compiles once
+FILTERS_TEMPLATE = """
+          <div class="filter-container" id="filters-container" style="display: none;">
+              <form method="get" class="filter-bar">
+                    {% if include_unscheduled %}
+                    <input type="hidden" name="full" value="1">
+                    {% endif %}
+                    {% if show_report %}
+                    <input type="hidden" name="report" value="1">
+                    {% endif %}
+                    {% if selected_tile %}
+                    <input type="hidden" id="tile-input" name="tile" value="{{ selected_tile }}">
+                    {% else %}
+                    <input type="hidden" id="tile-input" name="tile" value="">
+                    {% endif %}
+                    <label for="lot-select">Lot #:</label>
+                    <select id="lot-select" name="lot">
+                      <option value="">All Lots</option>
+                      <option value="Lot #1" {% if selected_lot == 'Lot #1' %}selected{% endif %}>Lot #1</option>
+                      <option value="Lot #2" {% if selected_lot == 'Lot #2' %}selected{% endif %}>Lot #2</option>
+                      <option value="Lot #3" {% if selected_lot == 'Lot #3' %}selected{% endif %}>Lot #3</option>
+                  </select>
+                    <label for="region-select">Region:</label>
+                    <select id="region-select" name="region">
+                    <option value="">All Regions</option>
+                    {{ region_options_html }}
+                </select>
+                  <label for="schedule-select">Schedule:</label>
+                  <select id="schedule-select" name="schedule" multiple size="1">
+                    {{ schedule_options_html }}
+                </select>
+                  <label for="installation-select">Installation:</label>
+                    <select id="installation-select" name="installation">
+                      <option value="">All Installation Statuses</option>
+                      <option value="__blank__" {% if selected_installation == '__blank__' %}selected{% endif %}>No Installation Status</option>
+                      {{ installation_options_html }}
+                  </select>
+                  <label for="final-status-select">Final:</label>
+                  <select id="final-status-select" name="final">
+                      <option value="">All</option>
+                      {{ final_status_options_html }}
+                  </select>
+                  <label for="validated-select">Validated:</label>
+                  <select id="validated-select" name="validated">
+                      <option value="">All</option>
+                      {{ validated_options_html }}
+                  </select>
+                  <input
+                      id="search-input"
+                      type="text"
+                      name="search"
+                      value="{{ selected_search or '' }}"
+                      placeholder="Search..."
+                      style="font-size: 12px; padding: 3px 8px; border-radius: 9999px; border: 1px solid rgba(148,163,184,0.7); min-width: 140px; margin-left: 4px;"
+                  />
+                  <button type="submit" class="filter-toggle-btn" style="margin-left: 4px; padding: 3px 10px; font-size: 11px;">
+                      Apply
+                  </button>
+                  <a
+                      href="?{% if show_report %}report=1&{% endif %}{% if include_unscheduled %}full=1{% endif %}"
+                      class="filter-clear-link"
+                  >
+                      Clear filters
+                  </a>
+              </form>
+          </div>
+"""
+
+# One table body row, filled from pre-escaped cells for the page's first
+# window. Plain str.format skips the per-row Jinja frame.
+_ROW_TMPL = (
+    '<tr class="{13}">'
+    '<td class="region-cell">{0}</td>'
+    "<td>{1}</td>"
+    "<td>{2}</td>"
+    '<td class="school-cell">{3}</td>'
+    "<td>{4}</td>"
+    "<td>{5}</td>"
+    "<td>{time}</td>"
+    "<td>{8}</td>"
+    "<td>{9}</td>"
+    "<td>{10}</td>"
+    "<td>{11}</td>"
+    "<td>{12}</td>"
+    "</tr>\n"
+)
+
+# Compile the page once at import instead of on every request. The sources
+# never change at runtime, so {% include %} lookups skip the loader's
+# up-to-date check and always reuse the compiled template.
+_jinja_env = Environment(
+    loader=DictLoader({
+        "dashboard.html": TEMPLATE,
+        "filters.html": FILTERS_TEMPLATE,
+        "card.html": CARD_TEMPLATE,
+    }),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=400,
+)
+_jinja_env.globals["stylesheet_url"] = STYLESHEET_URL
+_jinja_env.globals["report_stylesheet_url"] = REPORT_STYLESHEET_URL
+_jinja_env.globals["charts_script_url"] = CHARTS_SCRIPT_URL
+_template = _jinja_env.get_template("dashboard.html")
+_card_template = _jinja_env.get_template("card.html")
+
+
+def iter_rows(rows: dict[str, list]):
+    """Yield one {column: value} dict per row from get_table_data's columnar rows."""
+    keys = list(rows)
+    for values in zip(*rows.values()):
+        yield dict(zip(keys, values))
+
+
+def _rows_html(rows: dict[str, list], offset: int) -> Markup:
+    """Table body markup for the PAGE_SIZE window at offset, built in one join."""
+    parts = []
+    for cells in _window_rows(rows, offset):
+        start, end = cells[6], cells[7]
+        parts.append(_ROW_TMPL.format(*cells, time=f"{start} - {end}" if start and end else start or end))
+    return Markup("".join(parts))
+
+
+def _window_rows(rows: dict[str, list], offset: int) -> list[tuple[Markup, ...]]:
+    """Pre-escaped cell tuples (in _ROW_CELLS order) for the PAGE_SIZE window at offset.
+
+    Escaping whole columns here spares the template one escape() and one
+    dict lookup per cell; status columns become their prebuilt pill markup.
+    """
+    window = slice(offset, offset + PAGE_SIZE)
+    columns = [
+        list(map(_CELL_FORMATTERS.get(col, _escape_cell), rows[col][window]))
+        for col in _ROW_CELLS
+    ]
+    return list(zip(*columns))
 
-  (function () {
-      const active = {{ 'true' if stats.active else 'false' }};
-      if (!active) return;
-
-      // Starlink doughnut (Activated vs Not Activated)
-      const starEl = document.getElementById('starChart');
-      if (starEl) {
-          const starCtx = starEl.getContext('2d');
-          const starData = [{{ stats.star_activated }}, {{ stats.star_not_activated }}];
-          new Chart(starCtx, {
-              type: 'doughnut',
-              data: {
-                  labels: ['Activated', 'Not Activated'],
-                  datasets: [{
-                      data: starData,
-                      backgroundColor: [
-                          'rgba(34, 197, 94, 0.90)',   // green
-                          'rgba(239, 68, 68, 0.90)',   // red
-                      ],
-                      borderColor: '#ffffff',
-                      borderWidth: 1,
-                      hoverOffset: 6,
-                  }]
-              },
-              options: {
-                  responsive: true,
-                  cutout: '55%',
-                  plugins: {
-                      legend: {
-                          position: 'bottom',
-                          labels: { boxWidth: 8, font: { size: 8 } }
-                      },
-                      tooltip: {
-                          callbacks: {
-                              label: function (context) {
-                                  const data = context.dataset.data || [];
-                                  const total = data.reduce((a, b) => a + b, 0) || 1;
-                                  const value = context.parsed;
-                                  const pct = ((value / total) * 100).toFixed(1);
-                                  return `${context.label}: ${value} (${pct}%)`;
-                              }
-                          }
-                      }
-                  }
-              }
-          });
-      }
 
-      // Approval doughnut (Accepted / Pending / Decline)
-      const apprEl = document.getElementById('approvalChart');
-      if (apprEl) {
-          const apprCtx = apprEl.getContext('2d');
-          const apprData = [
-              {{ stats.approval_accepted }},
-              {{ stats.approval_pending }},
-              {{ stats.approval_decline }},
-          ];
-          new Chart(apprCtx, {
-              type: 'doughnut',
-              data: {
-                  labels: ['Accepted', 'Pending/Blank', 'Decline/Other'],
-                  datasets: [{
-                      data: apprData,
-                      backgroundColor: [
-                          'rgba(34, 197, 94, 0.90)',   // green
-                          'rgba(250, 204, 21, 0.95)',  // yellow
-                          'rgba(239, 68, 68, 0.90)',   // red
-                      ],
-                      borderColor: '#ffffff',
-                      borderWidth: 1,
-                      hoverOffset: 6,
-                  }]
-              },
-              options: {
-                  responsive: true,
-                  cutout: '55%',
-                  plugins: {
-                      legend: {
-                          position: 'bottom',
-                          labels: { boxWidth: 8, font: { size: 8 } }
-                      },
-                      tooltip: {
-                          callbacks: {
-                              label: function (context) {
-                                  const data = context.dataset.data || [];
-                                  const total = data.reduce((a, b) => a + b, 0) || 1;
-                                  const value = context.parsed;
-                                  const pct = ((value / total) * 100).toFixed(1);
-                                  return `${context.label}: ${value} (${pct}%)`;
-                              }
-                          }
-                      }
-                  }
-              }
-          });
-      }
-  })();
+def _escape_cell(value) -> Markup:
+    return escape(value or "")
 
-  (function () {
-      const toggleBtn = document.getElementById('toggle-filters');
-      const container = document.getElementById('filters-container');
-      if (!toggleBtn || !container) return;
 
-      let visible = false;
-      function update() {
-          container.style.display = visible ? 'block' : 'none';
-      }
-      toggleBtn.addEventListener('click', function () {
-          visible = !visible;
-          update();
-      });
-      // Keep filters hidden by default on load
-      update();
-  })();
+def _plain_cell(value) -> str:
+    return value or ""
 
-  (function () {
-      const backdrop = document.getElementById('report-modal-backdrop');
-      const openBtn = document.getElementById('open-report-modal');
-      const closeBtn = document.getElementById('close-report-modal');
-      const cancelBtn = document.getElementById('cancel-report-modal');
 
-      if (!backdrop || !openBtn || !closeBtn || !cancelBtn) return;
+# Status pills are looked up per distinct value: each status column only
+# holds a handful of them, so nearly every row is a cache hit.
+@lru_cache(maxsize=256)
+def _calendar_status(value: str) -> tuple[str, str]:
+    """(pill class, label) for a calendar status cell."""
+    if value == "Sent":
+        cls = "calendar-sent"
+    elif value:
+        cls = "calendar-not-sent"
+    else:
+        cls = ""
+    return cls, value or "-"
 
-      function openModal() {
-          backdrop.style.display = 'flex';
-      }
-      function closeModal() {
-          backdrop.style.display = 'none';
-      }
 
-      openBtn.addEventListener('click', openModal);
-      closeBtn.addEventListener('click', closeModal);
-      cancelBtn.addEventListener('click', closeModal);
-      backdrop.addEventListener('click', function (e) {
-          if (e.target === backdrop) {
-              closeModal();
-          }
-      });
-  })();
-  </script>
-  """
+@lru_cache(maxsize=256)
+def _starlink_status(value: str) -> tuple[str, str]:
+    """(pill class, label) for a Starlink status cell."""
+    cls = "status-ok" if str(value or "").lower() == "activated" else "status-bad"
+    return cls, value or "Not Activated"
+
+
+@lru_cache(maxsize=256)
+def _approval_status(value: str) -> tuple[str, str]:
+    """(pill class, label) for an approval cell."""
+    appr = str(value or "").lower()
+    if appr == "accepted":
+        cls = "status-ok"
+    elif appr in ("pending", ""):
+        cls = "status-warn"
+    else:
+        cls = "status-bad"
+    return cls, value or "Pending"
+
+
+@lru_cache(maxsize=256)
+def _calendar_pill(value: str) -> Markup:
+    return Markup('<span class="calendar-pill {}">{}</span>').format(*_calendar_status(value))
+
+
+@lru_cache(maxsize=256)
+def _starlink_pill(value: str) -> Markup:
+    return Markup('<span class="status-pill {}">{}</span>').format(*_starlink_status(value))
+
+
+@lru_cache(maxsize=256)
+def _approval_pill(value: str) -> Markup:
+    return Markup('<span class="status-pill {}">{}</span>').format(*_approval_status(value))
+
+
+_CELL_FORMATTERS = {
+    "Calendar Status": _calendar_pill,
+    "Starlink Status": _starlink_pill,
+    "Approval": _approval_pill,
+}
+
+_JSON_CELL_FORMATTERS = {
+    "Calendar Status": _calendar_status,
+    "Starlink Status": _starlink_status,
+    "Approval": _approval_status,
+}
+
+
+def _dashboard_context(context: dict, version) -> dict:
+    """Swap the columnar ``rows`` from get_table_data for the first window of cell tuples.
+
+    Only PAGE_SIZE rows are rendered into the page; the rest are fetched
+    by the table's scroll handler with ?offset=...&partial=ndjson&v=...,
+    where v is the sheet version the page was rendered from.
+    """
+    rows = context["rows"]
+    context["version"] = version_token(version)
+    offset = max(context.pop("offset", 0), 0)
+    context["row_count"] = len(rows["Region"])
+    context["next_offset"] = offset + PAGE_SIZE
+    context["page_size"] = PAGE_SIZE
+    context["row_height"] = ROW_HEIGHT_PX
+    context["rows_html"] = _rows_html(rows, offset)
+    del context["rows"]
+    stats = context["stats"]
+    context["chart_data"] = {
+        "starChart": [stats["star_activated"], stats["star_not_activated"]],
+        "approvalChart": [
+            stats["approval_accepted"],
+            stats["approval_pending"],
+            stats["approval_decline"],
+        ],
+    }
+    context["schedule_hidden"] = _schedule_hidden_inputs(context.get("selected_schedule_list") or [])
+    for name, selected in [
+        ("region_options", (context.get("selected_region"),)),
+        ("schedule_options", tuple(context.get("selected_schedule_list") or ())),
+        ("installation_options", (context.get("selected_installation"),)),
+        ("final_status_options", (context.get("selected_final"),)),
+        ("validated_options", (context.get("selected_validated"),)),
+    ]:
+        context[name + "_html"] = _options_html(tuple(context.get(name) or ()), selected)
+    return context
+
+
+@lru_cache(maxsize=512)
+def _options_html(options: tuple[str, ...], selected: tuple[str, ...]) -> Markup:
+    """<option> tags for a filter dropdown, marking the selected values.
+
+    Option lists only change with the sheet, so repeat requests reuse the
+    same markup.
+    """
+    return Markup("".join(
+        f'<option value="{escape(o)}"{" selected" if o in selected else ""}>{escape(o)}</option>'
+        for o in options
+    ))
+
+
+def _schedule_hidden_inputs(schedules: list[str]) -> Markup:
+    """Hidden schedule inputs carrying the current selection into the report form."""
+    return Markup("".join(
+        f'<input type="hidden" name="schedule" value="{escape(s)}">' for s in schedules or [""]
+    ))
+
+
+def rows_ndjson(rows: dict[str, list], offset: int = 0) -> bytes:
+    """One compact JSON array per row of the PAGE_SIZE window at offset (for ?partial=ndjson).
+
+    The page's scroll handler builds the <tr> elements from these, so
+    further windows ship plain values instead of full row markup.
+    """
+    window = slice(max(offset, 0), max(offset, 0) + PAGE_SIZE)
+    columns = [
+        list(map(_JSON_CELL_FORMATTERS.get(col, _plain_cell), rows[col][window]))
+        for col in _ROW_CELLS
+    ]
+    lines = []
+    for cells in zip(*columns):
+        start, end = cells[6], cells[7]
+        time = f"{start} - {end}" if start and end else start or end
+        lines.append(orjson.dumps([*cells[:6], time, *cells[8:]]))
+    return b"".join(line + b"\n" for line in lines)
+
+
+def render_card(version, **context) -> str:
+    """Render just the table and stats card (for ?partial=card)."""
+    return _card_template.render(**_dashboard_context(context, version))
+
+
+def stream_dashboard(cache_key, version, gzip_ok: bool = False, **context):
+    """Yield the dashboard page in chunks, caching the full page once rendered.
+
+    The first chunk (head, filters and the start of the table) goes out
+    before the remaining rows are formatted. With gzip_ok the chunks are
+    gzip members of one stream, each sync-flushed so the browser can
+    decode it as it arrives.
+    """
+    stream = _template.stream(**_dashboard_context(context, version))
+    # Flush every 200 template output pieces instead of per write
+    stream.enable_buffering(size=200)
+    parts = []
+    compressed = []
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    for chunk in stream:
+        parts.append(chunk)
+        if gzip_ok:
+            data = compressor.compress(chunk.encode("utf-8")) + compressor.flush(zlib.Z_SYNC_FLUSH)
+            compressed.append(data)
+            yield data
+        else:
+            yield chunk
+    if gzip_ok:
+        data = compressor.flush()
+        compressed.append(data)
+        yield data
+    cache_html(cache_key, version, "".join(parts), b"".join(compressed) if gzip_ok else None)